@@ -2,34 +2,40 @@
 
 __version__ = "0.1.0"
 
-from .config import Configuration
-from .models import (
-    PricePoint,
-    StockData,
-    SentimentSource,
-    SentimentData,
-    TechnicalIndicators,
-    FundamentalMetrics,
-    Recommendation,
-    Position,
-    ConcentrationRisk,
-    CorrelationRisk,
-    RiskAssessment,
-    AnalysisResult,
-)
-
-__all__ = [
-    "Configuration",
-    "PricePoint",
-    "StockData",
-    "SentimentSource",
-    "SentimentData",
-    "TechnicalIndicators",
-    "FundamentalMetrics",
-    "Recommendation",
-    "Position",
-    "ConcentrationRisk",
-    "CorrelationRisk",
-    "RiskAssessment",
-    "AnalysisResult",
-]
+import importlib
+
+# Public names and the submodule defining each. They are imported on first
+# access so that loading a light submodule (e.g. the CLI for --help) does not
+# pull in numpy and dotenv through this package.
+_EXPORTS = {
+    "Configuration": ".config",
+    "PricePoint": ".models",
+    "StockData": ".models",
+    "SentimentSource": ".models",
+    "SentimentData": ".models",
+    "TechnicalIndicators": ".models",
+    "FundamentalMetrics": ".models",
+    "Recommendation": ".models",
+    "Position": ".models",
+    "ConcentrationRisk": ".models",
+    "CorrelationRisk": ".models",
+    "RiskAssessment": ".models",
+    "AnalysisResult": ".models",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import a re-exported name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily re-exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,9 +6,11 @@ recommendation generation, and error handling.
 """
 
 import logging
-from typing import Optional, List
+import threading
+from typing import Callable, Optional, List
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 
 from src.config import Configuration
 from src.data_provider import DataProvider
@@ -16,7 +18,7 @@ from src.sentiment_analyzer import SentimentAnalyzer
 from src.technical_analyzer import TechnicalAnalyzer
 from src.fundamental_analyzer import FundamentalAnalyzer
 from src.recommendation_engine import RecommendationEngine
-from src.risk_manager import RiskManager
+from src.risk_manager import RiskManager, calculate_volatility
 from src.market_context_analyzer import MarketContextAnalyzer
 from src.no_trade_detector import NoTradeDetector
 from src.reversal_watch_detector import ReversalWatchDetector
@@ -37,6 +39,21 @@ from src.models import (
 
 logger = logging.getLogger(__name__)
 
+# Recommendation actions that are worth surfacing from a discovery scan
+_ACTIONABLE_ACTIONS = frozenset(('BUY', 'SELL'))
+
+# Indicators and fundamentals whose availability is checked for data quality
+_REQUIRED_INDICATORS = ('rsi', 'macd', 'ma_20', 'ma_50', 'ma_200')
+_REQUIRED_FUNDAMENTALS = ('pe_ratio', 'pb_ratio', 'revenue_growth')
+
+# Fixed field values for the neutral sentiment used when sentiment analysis fails
+_NEUTRAL_SENTIMENT_FIELDS = {
+    'sentiment_score': 0.0,
+    'confidence': 0.0,
+    'direction': "neutral",
+    'strength': 0.0,
+}
+
 
 class AnalysisError(Exception):
     """Exception raised when analysis fails."""
@@ -46,48 +63,73 @@ class AnalysisError(Exception):
 def analyze_discovered_stocks(
     discovered_stocks: List,
     agent_core: 'AgentCore',
-    portfolio: Optional[List[Position]] = None
+    portfolio: Optional[List[Position]] = None,
+    max_workers: int = 8,
+    on_progress: Optional[Callable[[int, int], None]] = None
 ) -> List[AnalysisResult]:
     """Analyze a list of discovered stocks using the existing analysis pipeline.
     
     This function accepts a list of DiscoveredStock objects from news discovery
-    and analyzes each symbol using the existing analyze_stock method. Individual
-    stock analysis failures are isolated and don't prevent other stocks from
-    being analyzed.
+    and analyzes each symbol using the existing analyze_stock method. Stocks are
+    analyzed concurrently since each analysis is dominated by network I/O.
+    Individual stock analysis failures are isolated and don't prevent other
+    stocks from being analyzed.
     
     Args:
         discovered_stocks: List of DiscoveredStock objects from news discovery
         agent_core: AgentCore instance to use for analysis
         portfolio: Optional list of portfolio positions for risk assessment
+        max_workers: Maximum number of stocks analyzed concurrently
+        on_progress: Optional callback invoked as on_progress(done, total)
+            each time a stock finishes, whether or not it succeeded
         
     Returns:
-        List of AnalysisResult objects for successfully analyzed stocks
+        List of AnalysisResult objects for successfully analyzed stocks,
+        in the same order as discovered_stocks
         
     Validates: Requirements 4.1, 9.3
     """
-    logger.info(f"Analyzing {len(discovered_stocks)} discovered stocks")
+    logger.info("Analyzing %d discovered stocks", len(discovered_stocks))
     
-    results = []
+    if not discovered_stocks:
+        logger.info("Analysis complete: 0 successful, 0 failed")
+        return []
+    
+    results_by_index = {}
     failed_count = 0
     
-    for stock in discovered_stocks:
-        try:
-            logger.info(f"Analyzing {stock.symbol} (mentions: {stock.mention_count})")
+    # Fetch every symbol's price history in one request up front
+    agent_core.data_provider.prefetch_history([stock.symbol for stock in discovered_stocks])
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(discovered_stocks)))) as executor:
+        futures = {}
+        for index, stock in enumerate(discovered_stocks):
+            logger.info("Analyzing %s (mentions: %s)", stock.symbol, stock.mention_count)
             
             # Call existing analyze_stock method
-            result = agent_core.analyze_stock(stock.symbol, portfolio)
-            results.append(result)
-            
-            logger.info(f"Successfully analyzed {stock.symbol}: {result.recommendation.action}")
+            future = executor.submit(agent_core.analyze_stock, stock.symbol, portfolio)
+            futures[future] = (index, stock)
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            index, stock = futures[future]
+            try:
+                result = future.result()
+                results_by_index[index] = result
+                
+                logger.info("Successfully analyzed %s: %s", stock.symbol, result.recommendation.action)
+                
+            except Exception as e:
+                # Log error but continue with remaining stocks (graceful error handling)
+                failed_count += 1
+                logger.error(f"Failed to analyze {stock.symbol}: {str(e)}")
             
-        except Exception as e:
-            # Log error but continue with remaining stocks (graceful error handling)
-            failed_count += 1
-            logger.error(f"Failed to analyze {stock.symbol}: {str(e)}")
-            continue
+            if on_progress is not None:
+                on_progress(done, len(discovered_stocks))
+    
+    results = [results_by_index[index] for index in sorted(results_by_index)]
     
     logger.info(
-        f"Analysis complete: {len(results)} successful, {failed_count} failed"
+        "Analysis complete: %d successful, %d failed", len(results), failed_count
     )
     
     return results
@@ -113,16 +155,19 @@ def filter_actionable_recommendations(
         
     Validates: Requirements 5.1, 5.2, 5.3, 5.5
     """
-    logger.info(f"Filtering {len(analysis_results)} analysis results for actionable recommendations")
+    logger.info("Filtering %d analysis results for actionable recommendations", len(analysis_results))
     
     # Step 1: Filter to include only BUY or SELL recommendations
     actionable_results = [
         result for result in analysis_results
-        if result.recommendation.action in ['BUY', 'SELL']
+        if result.recommendation.action in _ACTIONABLE_ACTIONS
     ]
     
     hold_count = len(analysis_results) - len(actionable_results)
-    logger.info(f"Filtered to {len(actionable_results)} actionable recommendations (excluded {hold_count} HOLD)")
+    logger.info(
+        "Filtered to %d actionable recommendations (excluded %d HOLD)",
+        len(actionable_results), hold_count
+    )
     
     # Step 2: Create mention count lookup if discovered_stocks provided
     mention_counts = {}
@@ -132,16 +177,17 @@ def filter_actionable_recommendations(
             for stock in discovered_stocks
         }
     
-    # Step 3: Sort by confidence score descending, then by mention count descending
-    def sort_key(result: AnalysisResult):
-        confidence = result.recommendation.confidence
-        mention_count = mention_counts.get(result.symbol, 0)
-        # Return tuple for multi-criteria sorting (higher values first)
-        return (-confidence, -mention_count)
-    
-    actionable_results.sort(key=sort_key)
+    # Step 3: Sort by confidence score descending, then by mention count descending.
+    # Keys are computed once per result; the index keeps the sort stable and
+    # ensures results themselves are never compared.
+    decorated = [
+        (-result.recommendation.confidence, -mention_counts.get(result.symbol, 0), index, result)
+        for index, result in enumerate(actionable_results)
+    ]
+    decorated.sort(key=itemgetter(0, 1, 2))
+    actionable_results = [entry[3] for entry in decorated]
     
-    logger.info(f"Sorted {len(actionable_results)} results by confidence and mention count")
+    logger.info("Sorted %d results by confidence and mention count", len(actionable_results))
     
     return actionable_results
 
@@ -157,9 +203,17 @@ class AgentCore:
     5. Handles errors gracefully
     """
     
+    # Worker threads shared by data fetching and analyzers. Each analysis
+    # uses up to 4 at once, so this covers 8 stocks analyzed concurrently.
+    MAX_POOL_WORKERS = 32
+    
     def __init__(self, config: Configuration):
         """Initialize the Agent Core with all components.
         
+        When performance tracking is enabled, trade history is loaded and
+        weights are auto-adjusted in the background; see wait_until_ready.
+        Failures there are logged rather than raised from the constructor.
+        
         Args:
             config: Configuration object with settings and API keys
         """
@@ -181,22 +235,70 @@ class AgentCore:
             enable_no_trade=True
         )
         self.reversal_watch_detector = ReversalWatchDetector()
-        self.data_quality_monitor = DataQualityMonitor()
         
-        # Initialize performance tracker if enabled
-        self.performance_tracker = None
+        # Long-lived pool reused by every analysis instead of creating
+        # threads per call
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_POOL_WORKERS,
+            thread_name_prefix='agent-core'
+        )
+        
+        # Data quality is tracked per analysis, so each thread gets its own
+        # monitor when several stocks are analyzed concurrently
+        self._thread_local = threading.local()
+        
+        # Initialize performance tracker if enabled. Loading trade history and
+        # adjusting weights reads from disk, so it runs in the background and
+        # overlaps with data fetching for the first analysis.
+        self._performance_tracker = None
+        self._performance_init_future = None
         if config.performance_tracking_enabled:
-            self.performance_tracker = PerformanceTracker(
-                storage_path=config.performance_storage_path
-            )
-            logger.info("Performance tracking enabled")
-            
-            # Auto-adjust weights if enabled and sufficient data exists
-            if config.auto_adjust_weights:
-                self._auto_adjust_weights()
+            self._performance_init_future = self._executor.submit(self._init_performance_tracking)
         
         logger.info("Agent Core initialized successfully")
     
+    def close(self) -> None:
+        """Shut down the worker pool and release network resources."""
+        self._executor.shutdown(wait=True)
+        self.data_provider.close()
+    
+    @property
+    def performance_tracker(self) -> Optional[PerformanceTracker]:
+        """Performance tracker, or None if tracking is disabled or failed to load.
+        
+        Waits for background performance tracking setup to finish.
+        """
+        self.wait_until_ready()
+        return self._performance_tracker
+    
+    def wait_until_ready(self) -> None:
+        """Block until background performance tracking setup has finished.
+        
+        Once this returns, performance_tracker is loaded and config weights
+        are auto-adjusted. Failures are logged rather than raised, since
+        recommendations can still be generated with the configured weights;
+        performance_tracker is then None if the tracker itself failed to load.
+        """
+        future = self._performance_init_future
+        if future is None:
+            return
+        
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Performance tracking initialization failed: {str(e)}", exc_info=True)
+        finally:
+            self._performance_init_future = None
+    
+    @property
+    def data_quality_monitor(self) -> DataQualityMonitor:
+        """Data quality monitor for the analysis running on the current thread."""
+        monitor = getattr(self._thread_local, 'data_quality_monitor', None)
+        if monitor is None:
+            monitor = DataQualityMonitor()
+            self._thread_local.data_quality_monitor = monitor
+        return monitor
+    
     def analyze_stock(
         self,
         symbol: str,
@@ -222,31 +324,31 @@ class AgentCore:
             
         Validates: Requirements 9.4, 9.5, 9.6
         """
-        logger.info(f"Starting analysis for {symbol}")
+        logger.info("Starting analysis for %s", symbol)
         
         # Reset data quality monitor for new analysis
         self.data_quality_monitor.reset()
         
         try:
             # Phase 1: Data Acquisition
-            logger.info(f"Phase 1: Fetching data for {symbol}")
+            logger.info("Phase 1: Fetching data for %s", symbol)
             stock_data, news, social, financials = self._fetch_all_data(symbol)
             
             # Monitor data quality after fetching
             self._monitor_data_quality(stock_data, news, social, financials)
             
             # Phase 2: Parallel Analysis
-            logger.info(f"Phase 2: Running analyzers for {symbol}")
+            logger.info("Phase 2: Running analyzers for %s", symbol)
             sentiment, technical, fundamental = self._run_analyzers(
                 symbol, stock_data, news, social, financials
             )
             
             # Phase 2.5: Get Market Context
-            logger.info(f"Phase 2.5: Fetching market context")
+            logger.info("Phase 2.5: Fetching market context")
             market_context = self.market_context_analyzer.get_market_context()
             
             # Phase 2.6: Check No-Trade Conditions
-            logger.info(f"Phase 2.6: Checking no-trade conditions")
+            logger.info("Phase 2.6: Checking no-trade conditions")
             no_trade_signal = self.no_trade_detector.check_market_conditions(market_context)
             
             if no_trade_signal.is_no_trade:
@@ -259,19 +361,13 @@ class AgentCore:
             data_quality_report = self.data_quality_monitor.generate_report()
             
             # Apply confidence penalties from data quality issues
-            if data_quality_report.total_confidence_penalty > 0:
-                sentiment.confidence = self.data_quality_monitor.apply_confidence_penalty(
-                    sentiment.confidence, data_quality_report
-                )
-                technical.confidence = self.data_quality_monitor.apply_confidence_penalty(
-                    technical.confidence, data_quality_report
-                )
-                fundamental.confidence = self.data_quality_monitor.apply_confidence_penalty(
-                    fundamental.confidence, data_quality_report
-                )
+            has_quality_penalty = data_quality_report.total_confidence_penalty > 0
+            if has_quality_penalty:
+                self._apply_penalties(data_quality_report, sentiment, technical, fundamental)
             
             # Phase 3: Generate Recommendation
-            logger.info(f"Phase 3: Generating recommendation for {symbol}")
+            logger.info("Phase 3: Generating recommendation for %s", symbol)
+            self.wait_until_ready()
             recommendation = self.recommendation_engine.generate_recommendation(
                 sentiment=sentiment,
                 technical=technical,
@@ -281,14 +377,12 @@ class AgentCore:
             )
             
             # Apply confidence penalty to recommendation
-            if data_quality_report.total_confidence_penalty > 0:
-                recommendation.confidence = self.data_quality_monitor.apply_confidence_penalty(
-                    recommendation.confidence, data_quality_report
-                )
+            if has_quality_penalty:
+                self._apply_penalties(data_quality_report, recommendation)
             
             # Override BUY recommendations if no-trade signal is active
             if no_trade_signal.is_no_trade and recommendation.action == "BUY":
-                logger.info(f"Overriding BUY recommendation to HOLD due to no-trade signal")
+                logger.info("Overriding BUY recommendation to HOLD due to no-trade signal")
                 # Keep the original recommendation but change action to HOLD
                 # This preserves the analysis while blocking the trade
                 original_action = recommendation.action
@@ -304,7 +398,7 @@ class AgentCore:
             # Phase 4: Risk Assessment (optional)
             risk_assessment = None
             if portfolio:
-                logger.info(f"Phase 4: Assessing portfolio risk for {symbol}")
+                logger.info("Phase 4: Assessing portfolio risk for %s", symbol)
                 risk_assessment = self._assess_risk(
                     symbol, stock_data, recommendation, portfolio, market_context
                 )
@@ -321,10 +415,17 @@ class AgentCore:
                 )
                 if reversal_watch.is_reversal_setup:
                     logger.info(
-                        f"Reversal watch detected for {symbol}: "
-                        f"status={reversal_watch.status}, confidence={reversal_watch.confidence:.0%}"
+                        "Reversal watch detected for %s: status=%s, confidence=%.0f%%",
+                        symbol, reversal_watch.status, reversal_watch.confidence * 100
                     )
             
+            # Only attach optional signals that are actually active
+            active_no_trade_signal = no_trade_signal if no_trade_signal.is_no_trade else None
+            active_reversal_watch = (
+                reversal_watch if reversal_watch and reversal_watch.is_reversal_setup else None
+            )
+            quality_report = data_quality_report if data_quality_report.issues else None
+            
             # Create final result
             result = AnalysisResult(
                 symbol=symbol,
@@ -337,18 +438,29 @@ class AgentCore:
                 market_context=market_context,
                 risk_assessment=risk_assessment,
                 stock_data=stock_data,
-                no_trade_signal=no_trade_signal if no_trade_signal.is_no_trade else None,
-                reversal_watch=reversal_watch if reversal_watch and reversal_watch.is_reversal_setup else None,
-                data_quality_report=data_quality_report if data_quality_report.issues else None
+                no_trade_signal=active_no_trade_signal,
+                reversal_watch=active_reversal_watch,
+                data_quality_report=quality_report
             )
             
-            logger.info(f"Analysis complete for {symbol}: {recommendation.action}")
+            logger.info("Analysis complete for %s: %s", symbol, recommendation.action)
             return result
             
         except Exception as e:
             logger.error(f"Analysis failed for {symbol}: {str(e)}", exc_info=True)
             raise AnalysisError(f"Failed to analyze {symbol}: {str(e)}") from e
     
+    def _apply_penalties(self, report, *targets):
+        """Apply the data quality confidence penalty to analysis results.
+        
+        Args:
+            report: Data quality report with penalties
+            *targets: Objects with a confidence attribute to adjust in place
+        """
+        apply_penalty = self.data_quality_monitor.apply_confidence_penalty
+        for target in targets:
+            target.confidence = apply_penalty(target.confidence, report)
+    
     def _monitor_data_quality(self, stock_data, news, social, financials):
         """Monitor data quality and record issues.
         
@@ -359,9 +471,8 @@ class AgentCore:
             financials: Company financials object
         """
         # Check news availability
-        total_sources = len(news) + len(social)
         self.data_quality_monitor.check_news_availability(
-            news_sources=news + social,
+            total_sources=len(news) + len(social),
             expected_minimum=5
         )
         
@@ -373,21 +484,20 @@ class AgentCore:
         
         # Check technical indicator completeness
         if stock_data.historical_prices:
-            required_indicators = ['rsi', 'macd', 'ma_20', 'ma_50', 'ma_200']
+            price_count = len(stock_data.historical_prices)
             available_indicators = {
-                'rsi': len(stock_data.historical_prices) >= 14,
-                'macd': len(stock_data.historical_prices) >= 26,
-                'ma_20': len(stock_data.historical_prices) >= 20,
-                'ma_50': len(stock_data.historical_prices) >= 50,
-                'ma_200': len(stock_data.historical_prices) >= 200,
+                'rsi': price_count >= 14,
+                'macd': price_count >= 26,
+                'ma_20': price_count >= 20,
+                'ma_50': price_count >= 50,
+                'ma_200': price_count >= 200,
             }
             self.data_quality_monitor.check_indicator_completeness(
                 technical_indicators=available_indicators,
-                required_indicators=required_indicators
+                required_indicators=_REQUIRED_INDICATORS
             )
         
         # Check fundamental completeness
-        required_fundamentals = ['pe_ratio', 'pb_ratio', 'revenue_growth']
         available_fundamentals = {
             'pe_ratio': financials.pe_ratio,
             'pb_ratio': financials.pb_ratio,
@@ -395,12 +505,16 @@ class AgentCore:
         }
         self.data_quality_monitor.check_fundamental_completeness(
             fundamental_metrics=available_fundamentals,
-            required_metrics=required_fundamentals
+            required_metrics=_REQUIRED_FUNDAMENTALS
         )
     
     def _fetch_all_data(self, symbol: str):
         """Fetch all required data for analysis.
         
+        The four data sources are fetched concurrently since each is an
+        independent network call. Results are then checked in a fixed order
+        so error handling matches a sequential fetch.
+        
         Args:
             symbol: Stock ticker symbol
             
@@ -410,33 +524,39 @@ class AgentCore:
         Raises:
             AnalysisError: If critical data fetching fails
         """
+        executor = self._executor
+        f_stock = executor.submit(self.data_provider.get_stock_data, symbol)
+        f_news = executor.submit(self.data_provider.get_news, symbol)
+        f_social = executor.submit(self.data_provider.get_social_media, symbol)
+        f_financials = executor.submit(self.data_provider.get_company_financials, symbol)
+        
         try:
-            # Fetch stock data (critical)
-            stock_data = self.data_provider.get_stock_data(symbol)
-            logger.info(f"Fetched stock data for {symbol}: ${stock_data.current_price:.2f}")
+            # Stock data (critical)
+            stock_data = f_stock.result()
+            logger.info("Fetched stock data for %s: $%.2f", symbol, stock_data.current_price)
             
-            # Fetch news (non-critical)
+            # News (non-critical)
             try:
-                news = self.data_provider.get_news(symbol)
-                logger.info(f"Fetched {len(news)} news articles for {symbol}")
+                news = f_news.result()
+                logger.info("Fetched %d news articles for %s", len(news), symbol)
             except Exception as e:
                 logger.warning(f"Failed to fetch news for {symbol}: {str(e)}")
                 self.data_quality_monitor.check_api_failures("News API", str(e))
                 news = []
             
-            # Fetch social media (non-critical)
+            # Social media (non-critical)
             try:
-                social = self.data_provider.get_social_media(symbol)
-                logger.info(f"Fetched {len(social)} social posts for {symbol}")
+                social = f_social.result()
+                logger.info("Fetched %d social posts for %s", len(social), symbol)
             except Exception as e:
                 logger.warning(f"Failed to fetch social media for {symbol}: {str(e)}")
                 self.data_quality_monitor.check_api_failures("Social Media API", str(e))
                 social = []
             
-            # Fetch financials (critical)
+            # Financials (critical)
             try:
-                financials = self.data_provider.get_company_financials(symbol)
-                logger.info(f"Fetched financials for {symbol}")
+                financials = f_financials.result()
+                logger.info("Fetched financials for %s", symbol)
             except Exception as e:
                 logger.error(f"Failed to fetch financials for {symbol}: {str(e)}")
                 self.data_quality_monitor.check_api_failures("Yahoo Finance API", str(e))
@@ -483,58 +603,58 @@ class AgentCore:
         technical = None
         fundamental = None
         
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit all analysis tasks
-            futures = {}
-            
-            # Sentiment analysis (non-critical)
-            futures['sentiment'] = executor.submit(
-                self._run_sentiment_analysis,
-                symbol, news, social
-            )
-            
-            # Technical analysis (critical)
-            futures['technical'] = executor.submit(
-                self._run_technical_analysis,
-                symbol, stock_data.historical_prices
-            )
-            
-            # Fundamental analysis (critical)
-            futures['fundamental'] = executor.submit(
-                self._run_fundamental_analysis,
-                financials, stock_data.current_price
-            )
-            
-            # Collect results as they complete
-            for future_name, future in futures.items():
-                try:
-                    result = future.result()
-                    
-                    if future_name == 'sentiment':
-                        sentiment = result
-                    elif future_name == 'technical':
-                        technical = result
-                    elif future_name == 'fundamental':
-                        fundamental = result
-                        
-                except Exception as e:
-                    logger.error(
-                        f"{future_name.capitalize()} analysis failed for {symbol}: {str(e)}",
-                        exc_info=True
-                    )
-                    
-                    # Handle graceful degradation
-                    if future_name == 'sentiment':
-                        # Sentiment is non-critical, create neutral sentiment
-                        logger.warning(f"Using neutral sentiment for {symbol} due to analysis failure")
-                        sentiment = self._create_neutral_sentiment(symbol)
-                    elif future_name == 'technical':
-                        # Technical is critical, re-raise
-                        raise AnalysisError(f"Technical analysis failed: {str(e)}") from e
-                    elif future_name == 'fundamental':
-                        # Fundamental is critical, re-raise
-                        raise AnalysisError(f"Fundamental analysis failed: {str(e)}") from e
+        # Run analyzers in parallel on the shared pool
+        executor = self._executor
+        
+        # Sentiment analysis (non-critical)
+        f_sent = executor.submit(
+            self._run_sentiment_analysis,
+            symbol, news, social
+        )
+        
+        # Technical analysis (critical)
+        f_tech = executor.submit(
+            self._run_technical_analysis,
+            symbol, stock_data.historical_prices
+        )
+        
+        # Fundamental analysis (critical)
+        f_fund = executor.submit(
+            self._run_fundamental_analysis,
+            financials, stock_data.current_price
+        )
+        
+        pending = {f_sent: 'sentiment', f_tech: 'technical', f_fund: 'fundamental'}
+        
+        # Collect results as they complete
+        for future in as_completed(pending):
+            try:
+                result = future.result()
+            except Exception as e:
+                future_name = pending[future]
+                logger.error(
+                    f"{future_name.capitalize()} analysis failed for {symbol}: {str(e)}",
+                    exc_info=True
+                )
+                
+                # Handle graceful degradation
+                if future is f_sent:
+                    # Sentiment is non-critical, create neutral sentiment
+                    logger.warning(f"Using neutral sentiment for {symbol} due to analysis failure")
+                    sentiment = self._create_neutral_sentiment(symbol)
+                    continue
+                
+                # Technical and fundamental are critical, re-raise
+                raise AnalysisError(
+                    f"{future_name.capitalize()} analysis failed: {str(e)}"
+                ) from e
+            
+            if future is f_sent:
+                sentiment = result
+            elif future is f_tech:
+                technical = result
+            else:
+                fundamental = result
         
         return sentiment, technical, fundamental
     
@@ -549,7 +669,7 @@ class AgentCore:
         Returns:
             SentimentData
         """
-        logger.debug(f"Running sentiment analysis for {symbol}")
+        logger.debug("Running sentiment analysis for %s", symbol)
         return self.sentiment_analyzer.analyze(news, social, symbol)
     
     def _run_technical_analysis(self, symbol: str, historical_prices):
@@ -562,7 +682,7 @@ class AgentCore:
         Returns:
             TechnicalIndicators
         """
-        logger.debug(f"Running technical analysis for {symbol}")
+        logger.debug("Running technical analysis for %s", symbol)
         return self.technical_analyzer.analyze(symbol, historical_prices)
     
     def _run_fundamental_analysis(self, financials, current_price):
@@ -575,7 +695,7 @@ class AgentCore:
         Returns:
             FundamentalMetrics
         """
-        logger.debug(f"Running fundamental analysis for {financials.symbol}")
+        logger.debug("Running fundamental analysis for %s", financials.symbol)
         return self.fundamental_analyzer.analyze(financials, current_price)
     
     def _create_neutral_sentiment(self, symbol: str) -> SentimentData:
@@ -589,12 +709,9 @@ class AgentCore:
         """
         return SentimentData(
             symbol=symbol,
-            sentiment_score=0.0,
-            confidence=0.0,
             sources=[],
             timestamp=datetime.now(),
-            direction="neutral",
-            strength=0.0
+            **_NEUTRAL_SENTIMENT_FIELDS
         )
     
     def _assess_risk(
@@ -618,10 +735,7 @@ class AgentCore:
         """
         try:
             # Calculate stock volatility from historical prices
-            import numpy as np
-            prices = [p.close for p in stock_data.historical_prices[-30:]]  # Last 30 days
-            returns = np.diff(prices) / prices[:-1]
-            volatility = np.std(returns)
+            volatility = calculate_volatility(stock_data.close_array)
             
             # Calculate total portfolio value
             portfolio_value = sum(p.current_value for p in portfolio)
@@ -652,38 +766,48 @@ class AgentCore:
                 risk_mitigation_actions=[]
             )
     
+    def _init_performance_tracking(self):
+        """Load performance history and auto-adjust weights if enabled."""
+        self._performance_tracker = PerformanceTracker(
+            storage_path=self.config.performance_storage_path
+        )
+        logger.info("Performance tracking enabled")
+        
+        # Auto-adjust weights if enabled and sufficient data exists
+        if self.config.auto_adjust_weights:
+            self._auto_adjust_weights()
+    
     def _auto_adjust_weights(self):
         """Automatically adjust recommendation weights based on performance."""
-        if not self.performance_tracker:
+        if not self._performance_tracker:
             return
         
         # Get closed trades
-        closed_trades = self.performance_tracker.get_closed_trades()
+        closed_trades = self._performance_tracker.get_closed_trades()
         
         # Check if we have enough trades
         if len(closed_trades) < self.config.min_trades_for_adjustment:
             logger.info(
-                f"Not enough trades for weight adjustment: "
-                f"{len(closed_trades)}/{self.config.min_trades_for_adjustment}"
+                "Not enough trades for weight adjustment: %d/%d",
+                len(closed_trades), self.config.min_trades_for_adjustment
             )
             return
         
         # Get latest recommended weights
-        recommended_weights = self.performance_tracker.get_latest_recommended_weights()
+        recommended_weights = self._performance_tracker.get_latest_recommended_weights()
         
         if not recommended_weights:
             logger.info("No recommended weights available yet")
             return
         
-        # Apply recommended weights
-        logger.info(f"Applying recommended weights: {recommended_weights}")
-        self.config.apply_recommended_weights(recommended_weights)
-        
-        # Update recommendation engine with new weights
-        self.recommendation_engine = RecommendationEngine(self.config)
+        # Apply recommended weights through the recommendation engine, which
+        # shares this configuration
+        logger.info("Applying recommended weights: %s", recommended_weights)
+        self.recommendation_engine.update_weights(recommended_weights)
         
         logger.info(
-            f"Weights adjusted: sentiment={self.config.sentiment_weight:.2f}, "
-            f"technical={self.config.technical_weight:.2f}, "
-            f"fundamental={self.config.fundamental_weight:.2f}"
+            "Weights adjusted: sentiment=%.2f, technical=%.2f, fundamental=%.2f",
+            self.config.sentiment_weight,
+            self.config.technical_weight,
+            self.config.fundamental_weight
         )
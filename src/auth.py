@@ -7,44 +7,71 @@ Provides simple username/password authentication with secure password hashing.
 import os
 import hashlib
 import hmac
-import streamlit as st
+from functools import lru_cache
 from typing import Optional, Tuple
 
+# streamlit is imported inside the UI methods so the hashing helpers and the
+# command-line hash generator don't pay its import cost
+
+
+# scrypt cost parameters (n=2**14, r=8 needs 16 MiB per hash)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_SALT_BYTES = 16
+
+# Scheme prefixes for AUTH_PASSWORD_HASH values. Stored hashes without a
+# prefix are legacy unsalted SHA-256 hex digests. scrypt fields are joined
+# with ':' so the value survives docker-compose's $-interpolation of .env.
+SCRYPT_PREFIX = "scrypt:"
+
+
+@lru_cache(maxsize=1)
+def _load_credentials() -> Tuple[str, str]:
+    """
+    Read the configured username and password hash once per process.
+    
+    Streamlit re-creates the Authenticator on every rerun, so deriving the
+    hash from AUTH_PASSWORD each time would repeat the scrypt work.
+    
+    Returns:
+        Tuple of (username, password_hash)
+    """
+    username = os.getenv('AUTH_USERNAME', 'admin')
+    
+    # Check if password hash is provided
+    password_hash = os.getenv('AUTH_PASSWORD_HASH')
+    if not password_hash:
+        # Otherwise, hash the plain password from environment
+        plain_password = os.getenv('AUTH_PASSWORD', 'changeme')
+        password_hash = generate_password_hash(plain_password)
+    
+    return username, password_hash
+
 
 class Authenticator:
     """Simple authentication handler for Streamlit apps."""
     
     def __init__(self):
         """Initialize authenticator with credentials from environment."""
+        import streamlit as st
+        
         # Get credentials from environment variables
-        self.username = os.getenv('AUTH_USERNAME', 'admin')
-        self.password_hash = self._get_password_hash()
+        self.username, self.password_hash = _load_credentials()
         
         # Initialize session state
         if 'authenticated' not in st.session_state:
             st.session_state.authenticated = False
         if 'username' not in st.session_state:
             st.session_state.username = None
-    
-    def _get_password_hash(self) -> str:
-        """Get password hash from environment or use default."""
-        # Check if password hash is provided
-        password_hash = os.getenv('AUTH_PASSWORD_HASH')
-        if password_hash:
-            return password_hash
         
-        # Otherwise, hash the plain password from environment
-        plain_password = os.getenv('AUTH_PASSWORD', 'changeme')
-        return self._hash_password(plain_password)
-    
-    def _hash_password(self, password: str) -> str:
-        """Hash password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+        # Snapshot session state; login/logout keep these in sync
+        self._auth_cached = st.session_state.get('authenticated', False)
+        self._user_cached = st.session_state.get('username')
     
     def _verify_password(self, password: str) -> bool:
         """Verify password against stored hash."""
-        password_hash = self._hash_password(password)
-        return hmac.compare_digest(password_hash, self.password_hash)
+        return verify_password_hash(password, self.password_hash)
     
     def login(self, username: str, password: str) -> Tuple[bool, str]:
         """
@@ -57,25 +84,36 @@ class Authenticator:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        if username == self.username and self._verify_password(password):
+        import streamlit as st
+        
+        # Check both fields in constant time and always run the password
+        # check, so response time doesn't reveal whether the username exists
+        username_ok = hmac.compare_digest(username.encode(), self.username.encode())
+        password_ok = self._verify_password(password)
+        if username_ok and password_ok:
             st.session_state.authenticated = True
             st.session_state.username = username
+            self._auth_cached = True
+            self._user_cached = username
             return True, "Login successful!"
         else:
             return False, "Invalid username or password"
     
     def logout(self):
         """Log out the current user."""
+        import streamlit as st
         st.session_state.authenticated = False
         st.session_state.username = None
+        self._auth_cached = False
+        self._user_cached = None
     
     def is_authenticated(self) -> bool:
         """Check if user is authenticated."""
-        return st.session_state.get('authenticated', False)
+        return self._auth_cached
     
     def get_username(self) -> Optional[str]:
         """Get the current authenticated username."""
-        return st.session_state.get('username')
+        return self._user_cached
     
     def require_authentication(self) -> bool:
         """
@@ -84,6 +122,8 @@ class Authenticator:
         Returns:
             True if authenticated, False otherwise
         """
+        import streamlit as st
+        
         if self.is_authenticated():
             return True
         
@@ -120,6 +160,8 @@ class Authenticator:
 
 def show_logout_button():
     """Show logout button in sidebar."""
+    import streamlit as st
+    
     auth = Authenticator()
     
     if auth.is_authenticated():
@@ -138,9 +180,70 @@ def generate_password_hash(password: str) -> str:
         password: Plain text password
         
     Returns:
-        SHA-256 hash of the password
+        Encoded scrypt hash in the form scrypt:n:r:p:salt:hash
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    salt = os.urandom(SCRYPT_SALT_BYTES)
+    digest = hashlib.scrypt(
+        password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P
+    )
+    return f"{SCRYPT_PREFIX}{SCRYPT_N}:{SCRYPT_R}:{SCRYPT_P}:{salt.hex()}:{digest.hex()}"
+
+
+@lru_cache(maxsize=8)
+def _parse_password_hash(password_hash: str) -> Optional[Tuple[str, tuple, bytes]]:
+    """
+    Decode a stored password hash into its scheme, KDF parameters and digest.
+    
+    Args:
+        password_hash: Stored hash in any supported format
+        
+    Returns:
+        Tuple of (scheme, params, expected digest bytes), or None if malformed
+    """
+    try:
+        if password_hash.startswith(SCRYPT_PREFIX):
+            n, r, p, salt_hex, digest_hex = password_hash[len(SCRYPT_PREFIX):].split(':')
+            params = (('salt', bytes.fromhex(salt_hex)), ('n', int(n)), ('r', int(r)), ('p', int(p)))
+            scheme, expected = 'scrypt', bytes.fromhex(digest_hex)
+        else:
+            params = ()
+            scheme, expected = 'sha256', bytes.fromhex(password_hash)
+    except ValueError:
+        return None
+    
+    if not expected:
+        return None
+    return scheme, params, expected
+
+
+def verify_password_hash(password: str, password_hash: str) -> bool:
+    """
+    Check a plain text password against a stored password hash.
+    
+    Accepts hashes from generate_password_hash as well as older unprefixed
+    SHA-256 hashes, so existing AUTH_PASSWORD_HASH values keep working.
+    
+    Args:
+        password: Plain text password
+        password_hash: Stored hash to compare against
+        
+    Returns:
+        True if the password matches, False otherwise
+    """
+    parsed = _parse_password_hash(password_hash)
+    if parsed is None:
+        return False
+    
+    # Compare raw digest bytes; the stored hash is only decoded once
+    scheme, params, expected = parsed
+    if scheme == 'scrypt':
+        try:
+            candidate = hashlib.scrypt(password.encode(), dklen=len(expected), **dict(params))
+        except ValueError:
+            return False
+    else:
+        candidate = hashlib.sha256(password.encode()).digest()
+    return hmac.compare_digest(candidate, expected)
 
 
 # Example usage for generating password hash
@@ -6,23 +6,261 @@ checking sentiment, and assessing portfolio risk.
 """
 
 import click
-from typing import Optional
-from rich.console import Console
+from contextlib import nullcontext
+from typing import List, NamedTuple, Optional, Tuple
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.style import Style
+from rich.text import Text
 from rich import box
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+import heapq
+from operator import attrgetter
+from types import MappingProxyType
+import os
 import sys
+import traceback
 
-from src.agent_core import AgentCore
-from src.config import Configuration
-from src.models import Position
 from src.symbol_lookup import SymbolLookup
 
 
 console = Console()
 
+# Display lookup tables used when rendering analysis results (read-only)
+_REGIME_DISPLAY = MappingProxyType({
+    "bullish-trend": "🟢 Bullish Trend",
+    "bearish-trend": "🔴 Bearish Trend",
+    "oversold-zone": "🟦 Oversold Zone (Potential Reversal)",
+    "overbought-zone": "🟧 Overbought Zone (Potential Reversal)",
+    "consolidation": "🟡 Consolidation (Sideways)",
+    "neutral": "⚪ Neutral"
+})
+_SEVERITY_EMOJI = MappingProxyType({"critical": "🔴", "major": "⚠️", "minor": "ℹ️"})
+_SEVERITY_COLOR = MappingProxyType({"critical": "red", "major": "yellow", "minor": "blue"})
+_NO_TRADE_SEVERITY_COLOR = MappingProxyType({"high": "red", "medium": "yellow", "low": "blue"})
+_ACTION_COLOR = MappingProxyType({"BUY": "green", "SELL": "red", "HOLD": "yellow"})
+_TREND_EMOJI = MappingProxyType({"bullish": "🟢", "neutral": "🟡", "bearish": "🔴"})
+_VIX_EMOJI = MappingProxyType({"low": "🟢", "moderate": "🟡", "high": "🟠", "very_high": "🔴"})
+_STATE_EMOJI = MappingProxyType({"bullish": "🟢", "neutral": "🟡", "bearish": "🔴", "volatile": "⚠️"})
+_STATE_COLOR = MappingProxyType({"bullish": "green", "neutral": "yellow", "bearish": "red", "volatile": "red"})
+
+# Pre-built styles for fixed-style cells, so rich does not parse markup for them
+_ACTION_STYLE = MappingProxyType({
+    action: Style(color=color, bold=True) for action, color in _ACTION_COLOR.items()
+})
+_DEFAULT_ACTION_STYLE = Style(color="white", bold=True)
+_ENTRY_STYLE = Style(color="green")
+_STOP_STYLE = Style(color="red")
+_TARGET_STYLE = Style(color="cyan")
+_BOLD_STYLE = Style(bold=True)
+_HEADING_STYLE = Style(color="cyan", bold=True)
+
+# Plain English summary phrases, ordered from weakest/most negative to strongest
+_ACTION_PHRASES = MappingProxyType({
+    "BUY": ("Consider buying", "This looks like a good opportunity to enter a position."),
+    "SELL": ("Consider selling", "This might be a good time to exit or reduce your position."),
+    "HOLD": ("Hold off for now", "Wait for clearer signals before making a move.")
+})
+_CONFIDENCE_PHRASES = ("low confidence", "moderate confidence", "high confidence")
+_SENTIMENT_PHRASES = (
+    "News and social media are negative",
+    "News sentiment is neutral",
+    "News and social media are positive"
+)
+_TECHNICAL_PHRASES = ("price momentum is weak", "price action is mixed", "price momentum is strong")
+_FUNDAMENTAL_PHRASES = ("fundamentals are concerning", "fundamentals are average", "fundamentals look solid")
+
+# Ticker suffixes of Indian exchanges (NSE, BSE), which are priced in rupees
+_INR_SUFFIXES = (".NS", ".BO")
+
+# (label, color) buckets ordered from worst to best / lowest to highest
+_SENTIMENT_BUCKETS = (("Negative", "red"), ("Neutral", "yellow"), ("Positive", "green"))
+_RISK_BUCKETS = (("Low", "green"), ("Moderate", "yellow"), ("High", "red"))
+_SCORE_COLORS = ("red", "yellow", "green")
+
+# (good, fair) thresholds for _band_color
+_AGREEMENT_BANDS = (0.75, 0.60)
+_WIN_RATE_BANDS = (60, 50)
+_ACCURACY_BANDS = (0.7, 0.5)
+
+# Risk adjustment tables for the analyze breakdown
+_MARKET_PENALTY_COEF = MappingProxyType({"bearish": 0.5, "volatile": 0.3, "neutral": 0.2})
+_NO_TRADE_PENALTY = MappingProxyType({"high": -0.30, "medium": -0.20, "low": -0.10})
+_VIX_PENALTY = MappingProxyType({"very_high": -0.25, "high": -0.15, "moderate": -0.05})
+
+
+class _MockDiscoveredStock(NamedTuple):
+    """Stand-in for a DiscoveredStock when scan is given explicit --symbols."""
+    symbol: str
+    mention_count: int = 0
+    sources: tuple = ()
+    sample_articles: tuple = ()
+
+
+def _impact_row(label: str, analysis) -> Tuple[str, str, str, str, str]:
+    """
+    Build a confidence breakdown row for one analyzer's signal.
+    
+    Net impact is strength x confidence, negated for bearish signals and
+    damped to 30% for neutral ones.
+    
+    Args:
+        label: Analyzer name shown in the first column
+        analysis: Sentiment, technical or fundamental result
+        
+    Returns:
+        Tuple of formatted (label, direction, strength, confidence, impact)
+    """
+    direction = analysis.direction
+    impact = analysis.strength * analysis.confidence
+    if direction == "bearish":
+        impact = -impact
+    elif direction == "neutral":
+        impact = impact * 0.3
+    
+    emoji = _TREND_EMOJI.get(direction, "🟡")
+    color = "green" if impact > 0 else "red" if impact < 0 else "yellow"
+    return (
+        label,
+        f"{emoji} {direction.capitalize()}",
+        _pct(analysis.strength),
+        _pct(analysis.confidence),
+        f"[{color}]{impact:+.2f}[/{color}]"
+    )
+
+
+def _sentiment_bucket(score: float) -> Tuple[str, str]:
+    """Get the (label, color) for a sentiment score: above 0.3 positive, below -0.3 negative."""
+    return _SENTIMENT_BUCKETS[1 + (score > 0.3) - (score < -0.3)]
+
+
+def _risk_bucket(score: float) -> Tuple[str, str]:
+    """Get the (label, color) for a portfolio risk score: below 0.3 low, below 0.7 moderate."""
+    return _RISK_BUCKETS[2 - (score < 0.3) - (score < 0.7)]
+
+
+def _band_color(value: float, bands: Tuple[float, float]) -> str:
+    """Get green at or above the good threshold, yellow at or above the fair one, else red."""
+    good, fair = bands
+    return _SCORE_COLORS[(value >= fair) + (value >= good)]
+
+
+def _price_range_rows(recommendation) -> List[Tuple[str, str]]:
+    """
+    Build the entry/exit range rows for a recommendation's summary table.
+    
+    Args:
+        recommendation: Recommendation with optional entry and exit bounds
+        
+    Returns:
+        List of (label, value) rows; a range is left out unless both bounds are set
+    """
+    rows = []
+    if recommendation.entry_price_low and recommendation.entry_price_high:
+        rows.append((
+            "Entry Range:",
+            f"${recommendation.entry_price_low:.2f} - ${recommendation.entry_price_high:.2f}"
+        ))
+    if recommendation.exit_price_low and recommendation.exit_price_high:
+        rows.append((
+            "Exit Range:",
+            f"${recommendation.exit_price_low:.2f} - ${recommendation.exit_price_high:.2f}"
+        ))
+    return rows
+
+
+def _status(message: str):
+    """
+    Show a single-line spinner while a blocking call runs.
+    
+    Uses console.status at 2 Hz rather than a multi-column Progress, and
+    does nothing when output is not a terminal.
+    
+    Args:
+        message: Text shown next to the spinner
+        
+    Returns:
+        Context manager wrapping the blocking call
+    """
+    if not console.is_terminal:
+        return nullcontext()
+    return console.status(message, spinner="dots", refresh_per_second=2)
+
+
+def _progress_to(status, message: str):
+    """
+    Build an on_progress callback that counts finished items on a status line.
+    
+    Args:
+        status: Object returned by entering _status, or None when not a terminal
+        message: Text shown before the (done/total) count
+        
+    Returns:
+        Callback taking (done, total), or None when there is no status line
+    """
+    if status is None:
+        return None
+    return lambda done, total: status.update(f"{message} ({done}/{total})")
+
+
+def _kv(rows: List[Tuple[str, str]]) -> Text:
+    """
+    Format label/value rows the way a borderless two-column Table would.
+    
+    Used for the small fixed sections of the analyze report, where building
+    and laying out a full rich Table is unnecessary.
+    
+    Args:
+        rows: (label, value) pairs; values may contain rich markup
+        
+    Returns:
+        Text block with aligned labels and a blank line above and below
+    """
+    width = max(len(label) for label, _ in rows)
+    body = "\n".join(f"  {label:<{width}}   {value}" for label, value in rows)
+    return Text.from_markup(f"\n{body}\n")
+
+
+def _pct(x: float) -> str:
+    """Format a 0-1 fraction as a whole-number percentage (e.g. 0.72 -> '72%')."""
+    return f"{x:.0%}"
+
+
+def _currency_for(symbol: str) -> Tuple[str, str]:
+    """Get the (currency symbol, currency code) for a ticker's exchange."""
+    if symbol.endswith(_INR_SUFFIXES):
+        return "₹", "INR"
+    return "$", "USD"
+
+
+@lru_cache(maxsize=8192)
+def _resolve_normalized(query: str) -> Tuple[Optional[str], Optional[str], str, str]:
+    """Resolve a normalised query to (ticker, company name, currency symbol, currency code)."""
+    ticker = SymbolLookup.lookup(query)
+    if not ticker:
+        return None, None, "$", "USD"
+    currency_symbol, currency_name = _currency_for(ticker)
+    return ticker, SymbolLookup.get_company_name(ticker), currency_symbol, currency_name
+
+
+def _resolve_symbol(query: str) -> Tuple[Optional[str], Optional[str], str, str]:
+    """
+    Resolve user input to a ticker plus its display details.
+    
+    Results are memoised per process, keyed on the same normalisation
+    SymbolLookup.lookup applies, so " Apple" and "apple" share an entry.
+    
+    Args:
+        query: Ticker symbol or company name as typed by the user
+        
+    Returns:
+        Tuple of (ticker or None, company name or None, currency symbol, currency code)
+    """
+    return _resolve_normalized(query.lower().strip())
+
 
 def _generate_plain_english_summary(result) -> str:
     """Generate a plain English summary of the analysis."""
@@ -32,65 +270,56 @@ def _generate_plain_english_summary(result) -> str:
     technical_score = result.technical.technical_score
     fundamental_score = result.fundamental.fundamental_score
     
-    # Determine action phrase
-    if action == "BUY":
-        action_phrase = "Consider buying"
-        action_advice = "This looks like a good opportunity to enter a position."
-    elif action == "SELL":
-        action_phrase = "Consider selling"
-        action_advice = "This might be a good time to exit or reduce your position."
-    else:  # HOLD
-        action_phrase = "Hold off for now"
-        action_advice = "Wait for clearer signals before making a move."
-    
-    # Determine confidence phrase
-    if confidence > 0.7:
-        confidence_phrase = "high confidence"
-    elif confidence > 0.4:
-        confidence_phrase = "moderate confidence"
-    else:
-        confidence_phrase = "low confidence"
+    action_phrase, action_advice = _ACTION_PHRASES.get(action, _ACTION_PHRASES["HOLD"])
     
-    # Analyze sentiment
-    if sentiment_score > 0.3:
-        sentiment_phrase = "News and social media are positive"
-    elif sentiment_score < -0.3:
-        sentiment_phrase = "News and social media are negative"
-    else:
-        sentiment_phrase = "News sentiment is neutral"
-    
-    # Analyze technicals
-    if technical_score > 0.3:
-        technical_phrase = "price momentum is strong"
-    elif technical_score < -0.3:
-        technical_phrase = "price momentum is weak"
-    else:
-        technical_phrase = "price action is mixed"
-    
-    # Analyze fundamentals
-    if fundamental_score > 0.3:
-        fundamental_phrase = "fundamentals look solid"
-    elif fundamental_score < -0.3:
-        fundamental_phrase = "fundamentals are concerning"
-    else:
-        fundamental_phrase = "fundamentals are average"
+    # Index phrase tables by counting thresholds crossed:
+    # confidence > 0.4 / > 0.7, scores < -0.3 (negative) / > 0.3 (positive)
+    confidence_phrase = _CONFIDENCE_PHRASES[(confidence > 0.4) + (confidence > 0.7)]
+    sentiment_phrase = _SENTIMENT_PHRASES[1 + (sentiment_score > 0.3) - (sentiment_score < -0.3)]
+    technical_phrase = _TECHNICAL_PHRASES[1 + (technical_score > 0.3) - (technical_score < -0.3)]
+    fundamental_phrase = _FUNDAMENTAL_PHRASES[1 + (fundamental_score > 0.3) - (fundamental_score < -0.3)]
     
     # Build summary
-    summary = f"{action_phrase} {result.recommendation.symbol} with {confidence_phrase} ({confidence:.0%}).\n\n"
-    summary += f"{sentiment_phrase}, {technical_phrase}, and {fundamental_phrase}. "
-    summary += f"{action_advice}"
+    summary = (
+        f"{action_phrase} {result.recommendation.symbol} with {confidence_phrase} ({confidence:.0%}).\n\n"
+        f"{sentiment_phrase}, {technical_phrase}, and {fundamental_phrase}. {action_advice}"
+    )
     
     # Add specific concerns or highlights
     if action == "HOLD":
         if abs(sentiment_score - technical_score) > 0.5 or abs(sentiment_score - fundamental_score) > 0.5:
-            summary += "\n\nThe signals are mixed - some indicators are positive while others are negative. "
-            summary += "It's best to wait for more alignment before taking action."
+            summary += (
+                "\n\nThe signals are mixed - some indicators are positive while others are negative. "
+                "It's best to wait for more alignment before taking action."
+            )
     
     return summary
 
 
+def _summary_panel(result, title: Optional[str] = None) -> Panel:
+    """
+    Wrap the plain English summary of a result in the standard cyan panel.
+    
+    Args:
+        result: AnalysisResult to summarise
+        title: Optional panel title
+        
+    Returns:
+        Panel containing the summary text
+    """
+    return Panel(_generate_plain_english_summary(result), title=title, border_style="cyan")
+
+
 def display_startup_disclaimer():
-    """Display startup disclaimer about educational purposes."""
+    """
+    Display startup disclaimer about educational purposes.
+    
+    Skipped when output is not a terminal (pipes, CI, cron) or when the
+    STOCK_AGENT_QUIET environment variable is set.
+    """
+    if not console.is_terminal or os.getenv('STOCK_AGENT_QUIET'):
+        return
+    
     disclaimer_text = """
 [bold yellow]⚠️  IMPORTANT DISCLAIMER[/bold yellow]
 
@@ -123,6 +352,244 @@ def display_risk_estimate_clarification():
     return "\n[dim]⚠️  Risk calculations are estimates based on historical data and may not reflect actual future risk.[/dim]"
 
 
+def _render_confidence_breakdown(result) -> list:
+    """
+    Build the confidence breakdown and active weights sections of analyze.
+    
+    Args:
+        result: AnalysisResult whose recommendation has a confidence_breakdown
+        
+    Returns:
+        List of renderables to print
+    """
+    breakdown = result.recommendation.confidence_breakdown
+    renderables = ["[bold]🔍 Confidence Breakdown[/bold]"]
+    
+    conf_table = Table(show_header=True, box=box.SIMPLE)
+    conf_table.add_column("Analyzer", style="bold")
+    conf_table.add_column("Direction", justify="center")
+    conf_table.add_column("Strength", justify="right")
+    conf_table.add_column("Confidence", justify="right")
+    conf_table.add_column("Net Impact", justify="right")
+    
+    # Calculate net impacts for each analyzer
+    for row in (
+        _impact_row("Sentiment", result.sentiment),
+        _impact_row("Technical", result.technical),
+        _impact_row("Fundamental", result.fundamental)
+    ):
+        conf_table.add_row(*row)
+    
+    renderables.append(conf_table)
+    renderables.append("")
+    
+    # Display additional metrics
+    # Agreement score
+    agreement_color = _band_color(breakdown.agreement_score, _AGREEMENT_BANDS)
+    metrics_rows = [
+        ("Agreement Score:", f"[{agreement_color}]{_pct(breakdown.agreement_score)}[/{agreement_color}]"),
+        # Market metrics (split into quality and favorability)
+        ("Market Signal Quality:", _pct(breakdown.market_signal_quality)),
+        ("Market Favorability:", _pct(breakdown.market_favorability))
+    ]
+    
+    # Data quality penalty (if any)
+    if breakdown.data_quality_penalty > 0:
+        metrics_rows.append(
+            ("Data Quality Penalty:", f"[red]-{_pct(breakdown.data_quality_penalty)}[/red]")
+        )
+    
+    renderables.append(_kv(metrics_rows))
+    renderables.append("")
+    
+    # Display runtime weights
+    if result.recommendation.runtime_weights:
+        renderables.append("[bold]⚖️  Active Weights[/bold]")
+        
+        # Determine mode based on market context and weights source
+        weights_source = result.recommendation.runtime_weights.get('source', 'unknown')
+        mode_desc = ""
+        
+        if weights_source.startswith('dynamic'):
+            if result.market_context:
+                market_state = result.market_context.market_state.capitalize()
+                mode_desc = f" ({market_state} Market - Dynamic)"
+            else:
+                mode_desc = " (Dynamic)"
+        elif weights_source == 'static':
+            mode_desc = " (Static Config)"
+        elif weights_source == 'static-fallback':
+            mode_desc = " (Static Fallback - No Market Data)"
+        
+        weights = result.recommendation.runtime_weights
+        
+        if mode_desc:
+            renderables.append(f"[dim]{mode_desc}[/dim]")
+        renderables.append(_kv([
+            ("Sentiment:", _pct(weights['sentiment'])),
+            ("Technical:", _pct(weights['technical'])),
+            ("Fundamental:", _pct(weights['fundamental']))
+        ]))
+        renderables.append("")
+    
+    return renderables
+
+
+def _render_risk_adjustments(result, breakdown) -> list:
+    """
+    Build the risk adjustments section of analyze.
+    
+    Args:
+        result: AnalysisResult being displayed
+        breakdown: The recommendation's ConfidenceBreakdown
+        
+    Returns:
+        List of renderables to print
+    """
+    renderables = ["[bold]📉 Risk Adjustments[/bold]"]
+    
+    # Calculate raw score (before penalties)
+    raw_score = (
+        result.recommendation.sentiment_contribution +
+        result.recommendation.technical_contribution +
+        result.recommendation.fundamental_contribution
+    )
+    
+    # Calculate market penalty (bullish markets carry none)
+    market_penalty = 0.0
+    if result.market_context:
+        coef = _MARKET_PENALTY_COEF.get(result.market_context.market_state)
+        if coef:
+            market_penalty = -(1.0 - breakdown.market_favorability) * coef
+    
+    # Calculate no-trade penalty based on severity
+    no_trade_penalty = 0.0
+    if result.no_trade_signal and result.no_trade_signal.is_no_trade:
+        no_trade_penalty = _NO_TRADE_PENALTY.get(result.no_trade_signal.severity, _NO_TRADE_PENALTY["low"])
+    
+    # Calculate volatility penalty from VIX (low VIX carries none)
+    volatility_penalty = 0.0
+    if result.market_context:
+        volatility_penalty = _VIX_PENALTY.get(result.market_context.vix_level, 0.0)
+    
+    # Data quality penalty (already in breakdown)
+    data_penalty = -breakdown.data_quality_penalty
+    
+    # Calculate adjusted score
+    penalties = (market_penalty, no_trade_penalty, volatility_penalty, data_penalty)
+    total_penalties = sum(penalties)
+    adjusted_score = raw_score + market_penalty + no_trade_penalty + volatility_penalty + data_penalty
+    
+    # Display penalties
+    risk_table = Table(show_header=False, box=box.SIMPLE)
+    
+    # Market penalty
+    if market_penalty != 0:
+        market_desc = ""
+        if result.market_context:
+            market_desc = f"({result.market_context.market_state.capitalize()} regime)"
+        penalty_color = "red" if market_penalty < 0 else "green"
+        risk_table.add_row(
+            "Market Penalty:",
+            f"[{penalty_color}]{market_penalty:+.2f}[/{penalty_color}] {market_desc}"
+        )
+    
+    # No-trade penalty
+    if no_trade_penalty != 0:
+        severity_desc = f"({result.no_trade_signal.severity.capitalize()} severity)"
+        risk_table.add_row(
+            "No-Trade Penalty:",
+            f"[red]{no_trade_penalty:+.2f}[/red] {severity_desc}"
+        )
+    
+    # Volatility penalty
+    if volatility_penalty != 0:
+        vix_desc = ""
+        if result.market_context:
+            vix_desc = f"(VIX: {result.market_context.vix_value:.1f})"
+        risk_table.add_row(
+            "Volatility Penalty:",
+            f"[red]{volatility_penalty:+.2f}[/red] {vix_desc}"
+        )
+    
+    # Data penalty
+    if data_penalty != 0:
+        risk_table.add_row(
+            "Data Penalty:",
+            f"[red]{data_penalty:+.2f}[/red]"
+        )
+    
+    # Show calculation if any penalties exist
+    if any(penalties):
+        renderables.append(risk_table)
+        renderables.append("")
+        
+        # Show score calculation
+        calc_table = Table(show_header=False, box=box.SIMPLE)
+        calc_table.add_row("Raw Score:", f"{raw_score:+.2f}")
+        penalty_color = "red" if total_penalties < 0 else "green"
+        calc_table.add_row("Total Penalties:", f"[{penalty_color}]{total_penalties:+.2f}[/{penalty_color}]")
+        calc_table.add_row("Adjusted Score:", f"[bold]{adjusted_score:+.2f}[/bold]")
+        renderables.append(calc_table)
+        renderables.append("")
+    else:
+        renderables.append("[dim]No risk penalties applied[/dim]")
+        renderables.append("")
+    
+    return renderables
+
+
+def _run_analysis(
+    query: str,
+    config: Optional[str],
+    heading: str,
+    status_message: str,
+    not_found_hint: Optional[str] = None
+):
+    """
+    Resolve a stock, announce it and run the full analysis behind a status line.
+    
+    Shared front half of analyze, recommend and sentiment; each command then
+    renders only the parts of the result it cares about. Exits with status 1
+    when the input does not resolve to a symbol.
+    
+    Args:
+        query: Ticker symbol or company name as typed by the user
+        config: Optional path to a configuration file
+        heading: Verb phrase shown before the stock name (e.g. "Analyzing")
+        status_message: Text shown next to the spinner while analysis runs
+        not_found_hint: Optional extra line printed when the lookup fails
+        
+    Returns:
+        Tuple of (ticker, AnalysisResult, currency symbol, currency code)
+    """
+    symbol, company_name, currency_symbol, currency_name = _resolve_symbol(query)
+    
+    if not symbol:
+        console.print(f"[bold red]Error:[/bold red] Could not find a matching stock symbol for '{query}'", style="red")
+        if not_found_hint:
+            console.print(f"\n[dim]{not_found_hint}[/dim]")
+        sys.exit(1)
+    
+    # Show what we're analyzing if it was converted
+    if company_name and company_name.lower() != query.lower():
+        console.print(f"\n[cyan]{heading} {company_name.title()} ({symbol})...[/cyan]\n")
+    else:
+        console.print(f"\n[bold cyan]{heading} {symbol}...[/bold cyan]\n")
+    
+    # Load configuration
+    from src.agent_core import AgentCore
+    from src.config import Configuration
+    cfg = Configuration.load(config) if config else Configuration()
+    agent = AgentCore(cfg)
+    
+    # Run analysis with progress indicator
+    with _status(status_message):
+        result = agent.analyze_stock(symbol)
+    
+    return symbol, result, currency_symbol, currency_name
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -139,7 +606,6 @@ def cli():
       portfolio  - Assess portfolio risk
       scan       - Scan multiple stocks and find BUY opportunities
     """
-    display_startup_disclaimer()
 
 
 @cli.command()
@@ -156,42 +622,20 @@ def analyze(symbol: str, config: Optional[str]):
         stock-agent analyze "idfc first bank"
         stock-agent analyze tesla
     """
+    display_startup_disclaimer()
+    
     try:
-        # Lookup symbol from user input
-        original_input = symbol
-        symbol = SymbolLookup.lookup(symbol)
-        
-        if not symbol:
-            console.print(f"[bold red]Error:[/bold red] Could not find a matching stock symbol for '{original_input}'", style="red")
-            console.print("\n[dim]Try using the exact ticker symbol or a more specific company name.[/dim]")
-            sys.exit(1)
-        
-        # Show what we're analyzing if it was converted
-        company_name = SymbolLookup.get_company_name(symbol)
-        if company_name and company_name.lower() != original_input.lower():
-            console.print(f"\n[cyan]Analyzing {company_name.title()} ({symbol})...[/cyan]\n")
-        else:
-            console.print(f"\n[bold cyan]Analyzing {symbol}...[/bold cyan]\n")
-        
-        # Load configuration
-        cfg = Configuration.load(config) if config else Configuration()
-        agent = AgentCore(cfg)
-        
-        # Run analysis with progress indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Fetching data and running analysis...", total=None)
-            result = agent.analyze_stock(symbol)
-            progress.update(task, completed=True)
+        symbol, result, currency_symbol, currency_name = _run_analysis(
+            symbol, config, "Analyzing", "Fetching data and running analysis...",
+            not_found_hint="Try using the exact ticker symbol or a more specific company name."
+        )
         
-        console.print()
+        # Collect the report and print it in one go once everything is built
+        renderables = [""]
         
         # Display data quality banner if issues exist
         if result.data_quality_report and result.data_quality_report.issues:
-            console.print()
+            renderables.append("")
             report = result.data_quality_report
             
             # Determine banner color based on severity
@@ -206,70 +650,57 @@ def analyze(symbol: str, config: Optional[str]):
                 banner_emoji = "ℹ️"
             
             # Build banner message
-            banner_text = f"[bold {banner_color}]{banner_emoji} DATA QUALITY ISSUES DETECTED[/bold {banner_color}]\n\n"
-            banner_text += f"[bold]Total Confidence Penalty:[/bold] [{banner_color}]-{report.total_confidence_penalty:.0%}[/{banner_color}]\n\n"
-            banner_text += "[bold]Issues Found:[/bold]\n"
+            banner_parts = [
+                f"[bold {banner_color}]{banner_emoji} DATA QUALITY ISSUES DETECTED[/bold {banner_color}]\n\n",
+                f"[bold]Total Confidence Penalty:[/bold] [{banner_color}]-{report.total_confidence_penalty:.0%}[/{banner_color}]\n\n",
+                "[bold]Issues Found:[/bold]\n"
+            ]
             
             for issue in report.issues:
                 # Severity emoji
-                severity_emoji = {"critical": "🔴", "major": "⚠️", "minor": "ℹ️"}.get(issue.severity, "•")
-                severity_color = {"critical": "red", "major": "yellow", "minor": "blue"}.get(issue.severity, "white")
+                severity_emoji = _SEVERITY_EMOJI.get(issue.severity, "•")
+                severity_color = _SEVERITY_COLOR.get(issue.severity, "white")
                 
-                banner_text += f"  [{severity_color}]{severity_emoji} {issue.source}[/{severity_color}]\n"
-                banner_text += f"     Reason: {issue.reason}\n"
-                banner_text += f"     Impact: {issue.impact}\n"
-                banner_text += f"     Penalty: -{issue.confidence_penalty:.0%}\n"
+                banner_parts.append(
+                    f"  [{severity_color}]{severity_emoji} {issue.source}[/{severity_color}]\n"
+                    f"     Reason: {issue.reason}\n"
+                    f"     Impact: {issue.impact}\n"
+                    f"     Penalty: -{issue.confidence_penalty:.0%}\n"
+                )
             
-            console.print(Panel(
-                banner_text,
+            renderables.append(Panel(
+                "".join(banner_parts),
                 title=f"{banner_emoji} Data Quality Alert",
                 border_style=banner_color,
                 box=box.DOUBLE
             ))
-            console.print()
+            renderables.append("")
         
         # Display current price
-        console.print("[bold]💰 Current Price[/bold]")
-        price_table = Table(show_header=False, box=box.SIMPLE)
-        
-        # Detect currency based on symbol suffix
-        if symbol.endswith('.NS') or symbol.endswith('.BO'):
-            currency_symbol = "₹"
-            currency_name = "INR"
-        else:
-            currency_symbol = "$"
-            currency_name = "USD"
-        
-        price_table.add_row("Price:", f"{currency_symbol}{result.current_price:.2f} {currency_name}")
-        price_table.add_row("Volume:", f"{result.volume:,}")
-        console.print(price_table)
-        console.print()
+        renderables.append("[bold]💰 Current Price[/bold]")
+        renderables.append(_kv([
+            ("Price:", f"{currency_symbol}{result.current_price:.2f} {currency_name}"),
+            ("Volume:", f"{result.volume:,}")
+        ]))
+        renderables.append("")
         
         # Display sentiment analysis
-        console.print("[bold]📊 Sentiment Analysis[/bold]")
-        sentiment_table = Table(show_header=False, box=box.SIMPLE)
-        sentiment_table.add_row("Score:", f"{result.sentiment.sentiment_score:+.2f}")
-        sentiment_table.add_row("Confidence:", f"{result.sentiment.confidence:.2%}")
-        sentiment_table.add_row("Sources:", f"{len(result.sentiment.sources)}")
-        console.print(sentiment_table)
-        console.print()
+        renderables.append("[bold]📊 Sentiment Analysis[/bold]")
+        renderables.append(_kv([
+            ("Score:", f"{result.sentiment.sentiment_score:+.2f}"),
+            ("Confidence:", f"{result.sentiment.confidence:.2%}"),
+            ("Sources:", f"{len(result.sentiment.sources)}")
+        ]))
+        renderables.append("")
         
         # Display technical analysis
-        console.print("[bold]📈 Technical Analysis[/bold]")
+        renderables.append("[bold]📈 Technical Analysis[/bold]")
         tech_table = Table(show_header=False, box=box.SIMPLE)
         tech_table.add_row("Technical Score:", f"{result.technical.technical_score:+.2f}")
         
         # Display regime with emoji and color
         regime = result.technical.regime
-        regime_display = {
-            "bullish-trend": "🟢 Bullish Trend",
-            "bearish-trend": "🔴 Bearish Trend",
-            "oversold-zone": "🟦 Oversold Zone (Potential Reversal)",
-            "overbought-zone": "🟧 Overbought Zone (Potential Reversal)",
-            "consolidation": "🟡 Consolidation (Sideways)",
-            "neutral": "⚪ Neutral"
-        }
-        regime_text = regime_display.get(regime, regime.replace("-", " ").title())
+        regime_text = _REGIME_DISPLAY.get(regime, regime.replace("-", " ").title())
         tech_table.add_row("Market Regime:", regime_text)
         
         # RSI with interpretation
@@ -290,25 +721,19 @@ def analyze(symbol: str, config: Optional[str]):
             macd_label = f"{macd_value:.2f} [red](Bearish)[/red]"
         tech_table.add_row("MACD:", macd_label)
         
-        # Detect currency for moving averages
-        if symbol.endswith('.NS') or symbol.endswith('.BO'):
-            currency_symbol = "₹"
-        else:
-            currency_symbol = "$"
-        
         tech_table.add_row("MA-20 (20-day avg):", f"{currency_symbol}{result.technical.ma_20:.2f}")
         tech_table.add_row("MA-50 (50-day avg):", f"{currency_symbol}{result.technical.ma_50:.2f}")
         tech_table.add_row("MA-200 (200-day avg):", f"{currency_symbol}{result.technical.ma_200:.2f}")
-        if result.technical.support_levels:
-            tech_table.add_row("Support (floor):", f"{currency_symbol}{min(result.technical.support_levels):.2f}")
-        if result.technical.resistance_levels:
-            tech_table.add_row("Resistance (ceiling):", f"{currency_symbol}{max(result.technical.resistance_levels):.2f}")
-        console.print(tech_table)
-        console.print("[dim]RSI: >70 overbought, <30 oversold | MACD: >0 bullish, <0 bearish[/dim]")
-        console.print()
+        if result.technical.support_floor is not None:
+            tech_table.add_row("Support (floor):", f"{currency_symbol}{result.technical.support_floor:.2f}")
+        if result.technical.resistance_ceiling is not None:
+            tech_table.add_row("Resistance (ceiling):", f"{currency_symbol}{result.technical.resistance_ceiling:.2f}")
+        renderables.append(tech_table)
+        renderables.append("[dim]RSI: >70 overbought, <30 oversold | MACD: >0 bullish, <0 bearish[/dim]")
+        renderables.append("")
         
         # Display fundamental analysis
-        console.print("[bold]💼 Fundamental Analysis[/bold]")
+        renderables.append("[bold]💼 Fundamental Analysis[/bold]")
         fund_table = Table(show_header=False, box=box.SIMPLE)
         fund_table.add_row("Fundamental Score:", f"{result.fundamental.fundamental_score:+.2f}")
         
@@ -356,17 +781,17 @@ def analyze(symbol: str, config: Optional[str]):
                 growth_label = f"{growth_value:+.1f}%"
             fund_table.add_row("Revenue Growth:", growth_label)
         
-        console.print(fund_table)
-        console.print("[dim]P/E: <15 cheap, >30 expensive | P/B: <1 undervalued, >3 expensive | Debt/Equity: <50 low, >100 high[/dim]")
-        console.print()
+        renderables.append(fund_table)
+        renderables.append("[dim]P/E: <15 cheap, >30 expensive | P/B: <1 undervalued, >3 expensive | Debt/Equity: <50 low, >100 high[/dim]")
+        renderables.append("")
         
         # Display market context (if available)
         if result.market_context:
-            console.print("[bold]🌍 Market Context[/bold]")
+            renderables.append("[bold]🌍 Market Context[/bold]")
             market_table = Table(show_header=False, box=box.SIMPLE)
             
             # Nifty 50
-            nifty_emoji = {"bullish": "🟢", "neutral": "🟡", "bearish": "🔴"}.get(result.market_context.nifty_trend, "")
+            nifty_emoji = _TREND_EMOJI.get(result.market_context.nifty_trend, "")
             market_table.add_row(
                 "Nifty 50:",
                 f"{nifty_emoji} {result.market_context.nifty_trend.capitalize()} "
@@ -374,7 +799,7 @@ def analyze(symbol: str, config: Optional[str]):
             )
             
             # Bank Nifty
-            banknifty_emoji = {"bullish": "🟢", "neutral": "🟡", "bearish": "🔴"}.get(result.market_context.banknifty_trend, "")
+            banknifty_emoji = _TREND_EMOJI.get(result.market_context.banknifty_trend, "")
             market_table.add_row(
                 "Bank Nifty:",
                 f"{banknifty_emoji} {result.market_context.banknifty_trend.capitalize()} "
@@ -382,7 +807,7 @@ def analyze(symbol: str, config: Optional[str]):
             )
             
             # VIX
-            vix_emoji = {"low": "🟢", "moderate": "🟡", "high": "🟠", "very_high": "🔴"}.get(result.market_context.vix_level, "")
+            vix_emoji = _VIX_EMOJI.get(result.market_context.vix_level, "")
             market_table.add_row(
                 "India VIX:",
                 f"{vix_emoji} {result.market_context.vix_level.replace('_', ' ').capitalize()} "
@@ -390,341 +815,78 @@ def analyze(symbol: str, config: Optional[str]):
             )
             
             # Overall market state
-            state_emoji = {"bullish": "🟢", "neutral": "🟡", "bearish": "🔴", "volatile": "⚠️"}.get(result.market_context.market_state, "")
-            state_color = {"bullish": "green", "neutral": "yellow", "bearish": "red", "volatile": "red"}.get(result.market_context.market_state, "white")
+            state_emoji = _STATE_EMOJI.get(result.market_context.market_state, "")
+            state_color = _STATE_COLOR.get(result.market_context.market_state, "white")
             market_table.add_row(
                 "Market State:",
                 f"{state_emoji} [bold {state_color}]{result.market_context.market_state.upper()}[/bold {state_color}]"
             )
             
-            console.print(market_table)
-            console.print()
+            renderables.append(market_table)
+            renderables.append("")
         
         # Display no-trade warning if active (BEFORE recommendation)
         if result.no_trade_signal and result.no_trade_signal.is_no_trade:
-            console.print()
-            severity_color = {
-                "high": "red",
-                "medium": "yellow",
-                "low": "blue"
-            }.get(result.no_trade_signal.severity, "yellow")
+            renderables.append("")
+            severity_color = _NO_TRADE_SEVERITY_COLOR.get(result.no_trade_signal.severity, "yellow")
             
-            warning_text = f"[bold {severity_color}]🚫 TRADING DISABLED TODAY[/bold {severity_color}]\n\n"
-            warning_text += "[bold]Dangerous Market Conditions Detected:[/bold]\n"
-            for reason in result.no_trade_signal.reasons:
-                warning_text += f"  • {reason}\n"
-            warning_text += f"\n[bold]Suggested Action:[/bold]\n{result.no_trade_signal.suggested_action}"
+            warning_parts = [
+                f"[bold {severity_color}]🚫 TRADING DISABLED TODAY[/bold {severity_color}]\n\n",
+                "[bold]Dangerous Market Conditions Detected:[/bold]\n"
+            ]
+            warning_parts.extend(f"  • {reason}\n" for reason in result.no_trade_signal.reasons)
+            warning_parts.append(f"\n[bold]Suggested Action:[/bold]\n{result.no_trade_signal.suggested_action}")
             
-            console.print(Panel(
-                warning_text,
+            renderables.append(Panel(
+                "".join(warning_parts),
                 title="⚠️  NO TRADE ZONE ⚠️",
                 border_style=severity_color,
                 box=box.DOUBLE
             ))
-            console.print()
+            renderables.append("")
         
         # Display recommendation
-        console.print("[bold]🎯 Recommendation[/bold]")
-        action_color = {
-            "BUY": "green",
-            "SELL": "red",
-            "HOLD": "yellow"
-        }.get(result.recommendation.action, "white")
-        
-        rec_table = Table(show_header=False, box=box.SIMPLE)
-        rec_table.add_row("Action:", f"[bold {action_color}]{result.recommendation.action}[/bold {action_color}]")
-        rec_table.add_row("Confidence:", f"{result.recommendation.confidence:.2%}")
+        renderables.append("[bold]🎯 Recommendation[/bold]")
+        action = result.recommendation.action
         
-        if result.recommendation.entry_price_low and result.recommendation.entry_price_high:
-            rec_table.add_row(
-                "Entry Range:",
-                f"${result.recommendation.entry_price_low:.2f} - ${result.recommendation.entry_price_high:.2f}"
-            )
-        if result.recommendation.exit_price_low and result.recommendation.exit_price_high:
-            rec_table.add_row(
-                "Exit Range:",
-                f"${result.recommendation.exit_price_low:.2f} - ${result.recommendation.exit_price_high:.2f}"
-            )
+        rec_rows = [
+            ("Action:", Text.assemble((action, _ACTION_STYLE.get(action, _DEFAULT_ACTION_STYLE)))),
+            ("Confidence:", f"{result.recommendation.confidence:.2%}")
+        ]
+        rec_rows.extend(_price_range_rows(result.recommendation))
         
-        console.print(rec_table)
-        console.print()
+        rec_table = Table(show_header=False, box=box.SIMPLE)
+        for row in rec_rows:
+            rec_table.add_row(*row)
+        renderables.append(rec_table)
+        renderables.append("")
         
         # Display confidence breakdown if available
         if result.recommendation.confidence_breakdown:
-            console.print("[bold]🔍 Confidence Breakdown[/bold]")
-            breakdown = result.recommendation.confidence_breakdown
-            
-            conf_table = Table(show_header=True, box=box.SIMPLE)
-            conf_table.add_column("Analyzer", style="bold")
-            conf_table.add_column("Direction", justify="center")
-            conf_table.add_column("Strength", justify="right")
-            conf_table.add_column("Confidence", justify="right")
-            conf_table.add_column("Net Impact", justify="right")
-            
-            # Calculate net impacts for each analyzer
-            # Sentiment
-            sentiment_impact = result.sentiment.strength * result.sentiment.confidence
-            if result.sentiment.direction == "bearish":
-                sentiment_impact = -sentiment_impact
-            elif result.sentiment.direction == "neutral":
-                sentiment_impact = sentiment_impact * 0.3
-            
-            sentiment_dir_emoji = "🟢" if result.sentiment.direction == "bullish" else "🔴" if result.sentiment.direction == "bearish" else "🟡"
-            sentiment_impact_color = "green" if sentiment_impact > 0 else "red" if sentiment_impact < 0 else "yellow"
-            
-            conf_table.add_row(
-                "Sentiment",
-                f"{sentiment_dir_emoji} {result.sentiment.direction.capitalize()}",
-                f"{result.sentiment.strength:.0%}",
-                f"{result.sentiment.confidence:.0%}",
-                f"[{sentiment_impact_color}]{sentiment_impact:+.2f}[/{sentiment_impact_color}]"
-            )
-            
-            # Technical
-            technical_impact = result.technical.strength * result.technical.confidence
-            if result.technical.direction == "bearish":
-                technical_impact = -technical_impact
-            elif result.technical.direction == "neutral":
-                technical_impact = technical_impact * 0.3
-            
-            technical_dir_emoji = "🟢" if result.technical.direction == "bullish" else "🔴" if result.technical.direction == "bearish" else "🟡"
-            technical_impact_color = "green" if technical_impact > 0 else "red" if technical_impact < 0 else "yellow"
-            
-            conf_table.add_row(
-                "Technical",
-                f"{technical_dir_emoji} {result.technical.direction.capitalize()}",
-                f"{result.technical.strength:.0%}",
-                f"{result.technical.confidence:.0%}",
-                f"[{technical_impact_color}]{technical_impact:+.2f}[/{technical_impact_color}]"
-            )
-            
-            # Fundamental
-            fundamental_impact = result.fundamental.strength * result.fundamental.confidence
-            if result.fundamental.direction == "bearish":
-                fundamental_impact = -fundamental_impact
-            elif result.fundamental.direction == "neutral":
-                fundamental_impact = fundamental_impact * 0.3
-            
-            fundamental_dir_emoji = "🟢" if result.fundamental.direction == "bullish" else "🔴" if result.fundamental.direction == "bearish" else "🟡"
-            fundamental_impact_color = "green" if fundamental_impact > 0 else "red" if fundamental_impact < 0 else "yellow"
-            
-            conf_table.add_row(
-                "Fundamental",
-                f"{fundamental_dir_emoji} {result.fundamental.direction.capitalize()}",
-                f"{result.fundamental.strength:.0%}",
-                f"{result.fundamental.confidence:.0%}",
-                f"[{fundamental_impact_color}]{fundamental_impact:+.2f}[/{fundamental_impact_color}]"
-            )
-            
-            console.print(conf_table)
-            console.print()
-            
-            # Display additional metrics
-            metrics_table = Table(show_header=False, box=box.SIMPLE)
-            
-            # Agreement score
-            agreement_color = "green" if breakdown.agreement_score >= 0.75 else "yellow" if breakdown.agreement_score >= 0.60 else "red"
-            metrics_table.add_row(
-                "Agreement Score:",
-                f"[{agreement_color}]{breakdown.agreement_score:.0%}[/{agreement_color}]"
-            )
-            
-            # Market metrics (split into quality and favorability)
-            metrics_table.add_row("Market Signal Quality:", f"{breakdown.market_signal_quality:.0%}")
-            metrics_table.add_row("Market Favorability:", f"{breakdown.market_favorability:.0%}")
-            
-            # Data quality penalty (if any)
-            if breakdown.data_quality_penalty > 0:
-                metrics_table.add_row(
-                    "Data Quality Penalty:",
-                    f"[red]-{breakdown.data_quality_penalty:.0%}[/red]"
-                )
-            
-            console.print(metrics_table)
-            console.print()
-            
-            # Display runtime weights
-            if result.recommendation.runtime_weights:
-                console.print("[bold]⚖️  Active Weights[/bold]")
-                
-                # Determine mode based on market context and weights source
-                weights_source = result.recommendation.runtime_weights.get('source', 'unknown')
-                mode_desc = ""
-                
-                if weights_source.startswith('dynamic'):
-                    if result.market_context:
-                        market_state = result.market_context.market_state.capitalize()
-                        mode_desc = f" ({market_state} Market - Dynamic)"
-                    else:
-                        mode_desc = " (Dynamic)"
-                elif weights_source == 'static':
-                    mode_desc = " (Static Config)"
-                elif weights_source == 'static-fallback':
-                    mode_desc = " (Static Fallback - No Market Data)"
-                
-                weights_table = Table(show_header=False, box=box.SIMPLE)
-                weights = result.recommendation.runtime_weights
-                weights_table.add_row("Sentiment:", f"{weights['sentiment']:.0%}")
-                weights_table.add_row("Technical:", f"{weights['technical']:.0%}")
-                weights_table.add_row("Fundamental:", f"{weights['fundamental']:.0%}")
-                
-                if mode_desc:
-                    console.print(f"[dim]{mode_desc}[/dim]")
-                console.print(weights_table)
-                console.print()
-            
-            # Display risk adjustments section
-            console.print("[bold]📉 Risk Adjustments[/bold]")
-            
-            # Calculate raw score (before penalties)
-            raw_score = (
-                result.recommendation.sentiment_contribution +
-                result.recommendation.technical_contribution +
-                result.recommendation.fundamental_contribution
-            )
-            
-            # Calculate market penalty
-            market_penalty = 0.0
-            if result.market_context:
-                # Market penalty based on market state and favorability
-                if result.market_context.market_state == "bearish":
-                    # Bearish market reduces confidence
-                    market_penalty = -(1.0 - breakdown.market_favorability) * 0.5
-                elif result.market_context.market_state == "volatile":
-                    # Volatile market reduces confidence
-                    market_penalty = -(1.0 - breakdown.market_favorability) * 0.3
-                elif result.market_context.market_state == "neutral":
-                    # Neutral market has small penalty
-                    market_penalty = -(1.0 - breakdown.market_favorability) * 0.2
-                # Bullish market has no penalty (or small bonus)
-            
-            # Calculate no-trade penalty
-            no_trade_penalty = 0.0
-            if result.no_trade_signal and result.no_trade_signal.is_no_trade:
-                # Penalty based on severity
-                if result.no_trade_signal.severity == "high":
-                    no_trade_penalty = -0.30
-                elif result.no_trade_signal.severity == "medium":
-                    no_trade_penalty = -0.20
-                else:  # low
-                    no_trade_penalty = -0.10
-            
-            # Calculate volatility penalty (from VIX)
-            volatility_penalty = 0.0
-            if result.market_context:
-                if result.market_context.vix_level == "very_high":
-                    volatility_penalty = -0.25
-                elif result.market_context.vix_level == "high":
-                    volatility_penalty = -0.15
-                elif result.market_context.vix_level == "moderate":
-                    volatility_penalty = -0.05
-                # Low VIX has no penalty
-            
-            # Data quality penalty (already in breakdown)
-            data_penalty = -breakdown.data_quality_penalty
-            
-            # Calculate adjusted score
-            adjusted_score = raw_score + market_penalty + no_trade_penalty + volatility_penalty + data_penalty
-            
-            # Display penalties
-            risk_table = Table(show_header=False, box=box.SIMPLE)
-            
-            # Market penalty
-            if market_penalty != 0:
-                market_desc = ""
-                if result.market_context:
-                    market_desc = f"({result.market_context.market_state.capitalize()} regime)"
-                penalty_color = "red" if market_penalty < 0 else "green"
-                risk_table.add_row(
-                    "Market Penalty:",
-                    f"[{penalty_color}]{market_penalty:+.2f}[/{penalty_color}] {market_desc}"
-                )
-            
-            # No-trade penalty
-            if no_trade_penalty != 0:
-                severity_desc = f"({result.no_trade_signal.severity.capitalize()} severity)"
-                risk_table.add_row(
-                    "No-Trade Penalty:",
-                    f"[red]{no_trade_penalty:+.2f}[/red] {severity_desc}"
-                )
-            
-            # Volatility penalty
-            if volatility_penalty != 0:
-                vix_desc = ""
-                if result.market_context:
-                    vix_desc = f"(VIX: {result.market_context.vix_value:.1f})"
-                risk_table.add_row(
-                    "Volatility Penalty:",
-                    f"[red]{volatility_penalty:+.2f}[/red] {vix_desc}"
-                )
-            
-            # Data penalty
-            if data_penalty != 0:
-                risk_table.add_row(
-                    "Data Penalty:",
-                    f"[red]{data_penalty:+.2f}[/red]"
-                )
-            
-            # Show calculation if any penalties exist
-            if market_penalty != 0 or no_trade_penalty != 0 or volatility_penalty != 0 or data_penalty != 0:
-                console.print(risk_table)
-                console.print()
-                
-                # Show score calculation
-                calc_table = Table(show_header=False, box=box.SIMPLE)
-                calc_table.add_row("Raw Score:", f"{raw_score:+.2f}")
-                total_penalties = market_penalty + no_trade_penalty + volatility_penalty + data_penalty
-                penalty_color = "red" if total_penalties < 0 else "green"
-                calc_table.add_row("Total Penalties:", f"[{penalty_color}]{total_penalties:+.2f}[/{penalty_color}]")
-                calc_table.add_row("Adjusted Score:", f"[bold]{adjusted_score:+.2f}[/bold]")
-                console.print(calc_table)
-                console.print()
-            else:
-                console.print("[dim]No risk penalties applied[/dim]")
-                console.print()
+            renderables.extend(_render_confidence_breakdown(result))
+            renderables.extend(_render_risk_adjustments(result, result.recommendation.confidence_breakdown))
         
         # Display trade levels if available (for BUY recommendations)
         if result.recommendation.trade_levels:
-            console.print("[bold]📍 Trade Levels[/bold]")
+            renderables.append("[bold]📍 Trade Levels[/bold]")
             levels = result.recommendation.trade_levels
             
-            # Detect currency
-            if symbol.endswith('.NS') or symbol.endswith('.BO'):
-                currency_symbol = "₹"
-            else:
-                currency_symbol = "$"
-            
             trade_table = Table(show_header=False, box=box.SIMPLE)
-            trade_table.add_row(
-                "Ideal Entry:",
-                f"[green]{currency_symbol}{levels.ideal_entry:.2f}[/green]"
-            )
-            trade_table.add_row(
-                "Stop Loss:",
-                f"[red]{currency_symbol}{levels.stop_loss:.2f}[/red]"
-            )
-            trade_table.add_row(
-                "Target:",
-                f"[cyan]{currency_symbol}{levels.target:.2f}[/cyan]"
-            )
-            trade_table.add_row(
-                "Risk per Trade:",
-                f"{levels.risk_per_trade_percent:.1f}% of capital"
-            )
-            trade_table.add_row(
-                "R:R Ratio:",
-                f"[bold]1:{levels.risk_reward_ratio:.1f}[/bold]"
-            )
-            trade_table.add_row(
-                "Position Size:",
-                f"{levels.position_size_percent:.1f}% of capital"
-            )
-            console.print(trade_table)
-            console.print()
+            for row in (
+                ("Ideal Entry:", Text.assemble((f"{currency_symbol}{levels.ideal_entry:.2f}", _ENTRY_STYLE))),
+                ("Stop Loss:", Text.assemble((f"{currency_symbol}{levels.stop_loss:.2f}", _STOP_STYLE))),
+                ("Target:", Text.assemble((f"{currency_symbol}{levels.target:.2f}", _TARGET_STYLE))),
+                ("Risk per Trade:", f"{levels.risk_per_trade_percent:.1f}% of capital"),
+                ("R:R Ratio:", Text.assemble((f"1:{levels.risk_reward_ratio:.1f}", _BOLD_STYLE))),
+                ("Position Size:", f"{levels.position_size_percent:.1f}% of capital")
+            ):
+                trade_table.add_row(*row)
+            renderables.append(trade_table)
+            renderables.append("")
         
         # Display reversal watch if detected
         if result.reversal_watch:
-            console.print()
+            renderables.append("")
             reversal = result.reversal_watch
             
             # Determine status styling
@@ -750,49 +912,49 @@ def analyze(symbol: str, config: Optional[str]):
             
             reversal_text += f"\n[bold]Analysis:[/bold]\n{reversal.reasoning}"
             
-            console.print(Panel(
+            renderables.append(Panel(
                 reversal_text,
                 title=f"{status_emoji} Reversal Watch",
                 border_style=status_color,
                 box=box.ROUNDED
             ))
-            console.print()
+            renderables.append("")
         
-        console.print("[bold]Reasoning:[/bold]")
-        console.print(result.recommendation.reasoning)
+        renderables.append("[bold]Reasoning:[/bold]")
+        renderables.append(result.recommendation.reasoning)
         
         # Display plain English summary
-        console.print()
-        console.print(Panel(
-            _generate_plain_english_summary(result),
-            title="📝 Plain English Summary",
-            border_style="cyan"
-        ))
+        renderables.append("")
+        renderables.append(_summary_panel(result, title="📝 Plain English Summary"))
         
         # Display risk assessment if available
         if result.risk_assessment:
-            console.print()
-            console.print("[bold]⚠️  Risk Assessment[/bold]")
+            renderables.append("")
+            renderables.append("[bold]⚠️  Risk Assessment[/bold]")
             risk_table = Table(show_header=False, box=box.SIMPLE)
-            risk_table.add_row("Portfolio Risk:", f"{result.risk_assessment.portfolio_risk_score:.2%}")
-            risk_table.add_row("Suggested Position:", f"{result.risk_assessment.suggested_position_size:.2%}")
-            console.print(risk_table)
+            for row in (
+                ("Portfolio Risk:", f"{result.risk_assessment.portfolio_risk_score:.2%}"),
+                ("Suggested Position:", f"{result.risk_assessment.suggested_position_size:.2%}")
+            ):
+                risk_table.add_row(*row)
+            renderables.append(risk_table)
             
             if result.risk_assessment.concentration_risks:
-                console.print("\n[yellow]Concentration Risks:[/yellow]")
-                for risk in result.risk_assessment.concentration_risks:
-                    console.print(f"  • {risk}")
+                renderables.append("\n[yellow]Concentration Risks:[/yellow]")
+                renderables.append("\n".join(f"  • {risk}" for risk in result.risk_assessment.concentration_risks))
             
             if result.risk_assessment.risk_mitigation_actions:
-                console.print("\n[cyan]Risk Mitigation:[/cyan]")
-                for action in result.risk_assessment.risk_mitigation_actions:
-                    console.print(f"  • {action}")
+                renderables.append("\n[cyan]Risk Mitigation:[/cyan]")
+                renderables.append("\n".join(f"  • {action}" for action in result.risk_assessment.risk_mitigation_actions))
             
-            console.print(display_risk_estimate_clarification())
+            renderables.append(display_risk_estimate_clarification())
         
         # Display disclaimers
-        console.print(display_recommendation_disclaimer())
-        console.print(display_past_performance_warning())
+        renderables.append(display_recommendation_disclaimer())
+        renderables.append(display_past_performance_warning())
+        
+        # Render the whole report in one pass instead of dozens of small writes
+        console.print(Group(*renderables))
         
     except ValueError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}", style="red")
@@ -817,100 +979,58 @@ def recommend(symbol: str, config: Optional[str]):
         stock-agent recommend TSLA
         stock-agent recommend "reliance"
     """
+    display_startup_disclaimer()
+    
     try:
-        # Lookup symbol from user input
-        original_input = symbol
-        symbol = SymbolLookup.lookup(symbol)
-        
-        if not symbol:
-            console.print(f"[bold red]Error:[/bold red] Could not find a matching stock symbol for '{original_input}'", style="red")
-            sys.exit(1)
-        
-        # Show what we're analyzing if it was converted
-        company_name = SymbolLookup.get_company_name(symbol)
-        if company_name and company_name.lower() != original_input.lower():
-            console.print(f"\n[cyan]Getting recommendation for {company_name.title()} ({symbol})...[/cyan]\n")
-        else:
-            console.print(f"\n[bold cyan]Getting recommendation for {symbol}...[/bold cyan]\n")
-        
-        # Load configuration
-        cfg = Configuration.load(config) if config else Configuration()
-        agent = AgentCore(cfg)
-        
-        # Run analysis with progress indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Analyzing...", total=None)
-            result = agent.analyze_stock(symbol)
-            progress.update(task, completed=True)
+        symbol, result, currency_symbol, _ = _run_analysis(
+            symbol, config, "Getting recommendation for", "Analyzing..."
+        )
         
-        console.print()
+        renderables = [""]
         
         # Display recommendation
-        action_color = {
-            "BUY": "green",
-            "SELL": "red",
-            "HOLD": "yellow"
-        }.get(result.recommendation.action, "white")
+        action_color = _ACTION_COLOR.get(result.recommendation.action, "white")
         
-        console.print(Panel(
+        renderables.append(Panel(
             f"[bold {action_color}]{result.recommendation.action}[/bold {action_color}]",
             title=f"Recommendation for {symbol}",
             border_style=action_color
         ))
         
-        console.print()
+        renderables.append("")
         
         # Display current price
         price_table = Table(show_header=False, box=box.SIMPLE)
         
-        # Detect currency based on symbol suffix
-        if symbol.endswith('.NS') or symbol.endswith('.BO'):
-            currency_symbol = "₹"
-        else:
-            currency_symbol = "$"
-        
         price_table.add_row("Current Price:", f"{currency_symbol}{result.current_price:.2f}")
-        console.print(price_table)
+        renderables.append(price_table)
+        
+        renderables.append("")
+        rec_rows = [("Confidence:", f"{result.recommendation.confidence:.2%}")]
+        rec_rows.extend(_price_range_rows(result.recommendation))
+        rec_rows.extend((
+            ("Sentiment:", f"{result.recommendation.sentiment_contribution:+.2f}"),
+            ("Technical:", f"{result.recommendation.technical_contribution:+.2f}"),
+            ("Fundamental:", f"{result.recommendation.fundamental_contribution:+.2f}")
+        ))
         
-        console.print()
         rec_table = Table(show_header=False, box=box.SIMPLE)
-        rec_table.add_row("Confidence:", f"{result.recommendation.confidence:.2%}")
-        
-        if result.recommendation.entry_price_low and result.recommendation.entry_price_high:
-            rec_table.add_row(
-                "Entry Range:",
-                f"${result.recommendation.entry_price_low:.2f} - ${result.recommendation.entry_price_high:.2f}"
-            )
-        if result.recommendation.exit_price_low and result.recommendation.exit_price_high:
-            rec_table.add_row(
-                "Exit Range:",
-                f"${result.recommendation.exit_price_low:.2f} - ${result.recommendation.exit_price_high:.2f}"
-            )
-        
-        rec_table.add_row("Sentiment:", f"{result.recommendation.sentiment_contribution:+.2f}")
-        rec_table.add_row("Technical:", f"{result.recommendation.technical_contribution:+.2f}")
-        rec_table.add_row("Fundamental:", f"{result.recommendation.fundamental_contribution:+.2f}")
-        
-        console.print(rec_table)
-        console.print()
-        console.print("[bold]Reasoning:[/bold]")
-        console.print(result.recommendation.reasoning)
+        for row in rec_rows:
+            rec_table.add_row(*row)
+        renderables.append(rec_table)
+        renderables.append("")
+        renderables.append("[bold]Reasoning:[/bold]")
+        renderables.append(result.recommendation.reasoning)
         
         # Display plain English summary
-        console.print()
-        console.print(Panel(
-            _generate_plain_english_summary(result),
-            title="📝 Plain English Summary",
-            border_style="cyan"
-        ))
+        renderables.append("")
+        renderables.append(_summary_panel(result, title="📝 Plain English Summary"))
         
         # Display disclaimers
-        console.print(display_recommendation_disclaimer())
-        console.print(display_past_performance_warning())
+        renderables.append(display_recommendation_disclaimer())
+        renderables.append(display_past_performance_warning())
+        
+        console.print(Group(*renderables))
         
     except ValueError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}", style="red")
@@ -935,66 +1055,46 @@ def sentiment(symbol: str, config: Optional[str]):
         stock-agent sentiment AAPL
         stock-agent sentiment "tata motors"
     """
+    display_startup_disclaimer()
+    
     try:
-        # Lookup symbol from user input
-        original_input = symbol
-        symbol = SymbolLookup.lookup(symbol)
-        
-        if not symbol:
-            console.print(f"[bold red]Error:[/bold red] Could not find a matching stock symbol for '{original_input}'", style="red")
-            sys.exit(1)
-        
-        # Show what we're analyzing if it was converted
-        company_name = SymbolLookup.get_company_name(symbol)
-        if company_name and company_name.lower() != original_input.lower():
-            console.print(f"\n[cyan]Analyzing sentiment for {company_name.title()} ({symbol})...[/cyan]\n")
-        else:
-            console.print(f"\n[bold cyan]Analyzing sentiment for {symbol}...[/bold cyan]\n")
-        
-        # Load configuration
-        cfg = Configuration.load(config) if config else Configuration()
-        agent = AgentCore(cfg)
-        
-        # Run analysis with progress indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Fetching sentiment data...", total=None)
-            result = agent.analyze_stock(symbol)
-            progress.update(task, completed=True)
+        symbol, result, _, _ = _run_analysis(
+            symbol, config, "Analyzing sentiment for", "Fetching sentiment data..."
+        )
         
-        console.print()
+        renderables = [""]
         
         # Display overall sentiment
         sentiment_score = result.sentiment.sentiment_score
-        sentiment_label = "Positive" if sentiment_score > 0.3 else "Negative" if sentiment_score < -0.3 else "Neutral"
-        sentiment_color = "green" if sentiment_score > 0.3 else "red" if sentiment_score < -0.3 else "yellow"
+        sentiment_label, sentiment_color = _sentiment_bucket(sentiment_score)
         
-        console.print(Panel(
+        renderables.append(Panel(
             f"[bold {sentiment_color}]{sentiment_label}[/bold {sentiment_color}] ({sentiment_score:+.2f})",
             title=f"Sentiment for {symbol}",
             border_style=sentiment_color
         ))
         
-        console.print()
-        summary_table = Table(show_header=False, box=box.SIMPLE)
-        summary_table.add_row("Sentiment Score:", f"{sentiment_score:+.2f}")
-        summary_table.add_row("Confidence:", f"{result.sentiment.confidence:.2%}")
-        summary_table.add_row("Total Sources:", f"{len(result.sentiment.sources)}")
+        renderables.append("")
         
         # Count by source type
-        news_count = sum(1 for s in result.sentiment.sources if s.source_type == "news")
-        social_count = sum(1 for s in result.sentiment.sources if s.source_type == "social")
-        summary_table.add_row("News Articles:", f"{news_count}")
-        summary_table.add_row("Social Posts:", f"{social_count}")
+        source_counts = Counter(s.source_type for s in result.sentiment.sources)
+        news_count = source_counts["news"]
+        social_count = source_counts["social"]
         
-        console.print(summary_table)
-        console.print()
+        summary_table = Table(show_header=False, box=box.SIMPLE)
+        for row in (
+            ("Sentiment Score:", f"{sentiment_score:+.2f}"),
+            ("Confidence:", f"{result.sentiment.confidence:.2%}"),
+            ("Total Sources:", f"{len(result.sentiment.sources)}"),
+            ("News Articles:", f"{news_count}"),
+            ("Social Posts:", f"{social_count}")
+        ):
+            summary_table.add_row(*row)
+        renderables.append(summary_table)
+        renderables.append("")
         
         # Display recent sources
-        console.print("[bold]Recent Sources:[/bold]")
+        renderables.append("[bold]Recent Sources:[/bold]")
         sources_table = Table(box=box.SIMPLE_HEAD)
         sources_table.add_column("Type", style="cyan")
         sources_table.add_column("Score", justify="right")
@@ -1002,10 +1102,11 @@ def sentiment(symbol: str, config: Optional[str]):
         sources_table.add_column("Preview", max_width=60)
         
         # Show up to 10 most recent sources
-        recent_sources = sorted(result.sentiment.sources, key=lambda s: s.timestamp, reverse=True)[:10]
+        recent_sources = heapq.nlargest(10, result.sentiment.sources, key=attrgetter("timestamp"))
+        now = datetime.now()
         for source in recent_sources:
-            score_color = "green" if source.score > 0 else "red" if source.score < 0 else "yellow"
-            time_ago = (datetime.now() - source.timestamp).total_seconds() / 3600
+            score_color = _SCORE_COLORS[1 + (source.score > 0) - (source.score < 0)]
+            time_ago = (now - source.timestamp).total_seconds() / 3600
             time_str = f"{int(time_ago)}h ago" if time_ago >= 1 else f"{int(time_ago * 60)}m ago"
             preview = source.content[:60] + "..." if len(source.content) > 60 else source.content
             
@@ -1016,10 +1117,12 @@ def sentiment(symbol: str, config: Optional[str]):
                 preview
             )
         
-        console.print(sources_table)
+        renderables.append(sources_table)
         
         # Display disclaimers
-        console.print(display_past_performance_warning())
+        renderables.append(display_past_performance_warning())
+        
+        console.print(Group(*renderables))
         
     except ValueError as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}", style="red")
@@ -1042,10 +1145,13 @@ def portfolio(config: Optional[str]):
     Example:
         stock-agent portfolio --config my_config.json
     """
+    display_startup_disclaimer()
+    
     try:
         console.print("\n[bold cyan]Assessing portfolio risk...[/bold cyan]\n")
         
         # Load configuration
+        from src.config import Configuration
         cfg = Configuration.load(config) if config else Configuration()
         
         if not hasattr(cfg, 'portfolio') or not cfg.portfolio:
@@ -1054,23 +1160,25 @@ def portfolio(config: Optional[str]):
             sys.exit(0)
         
         # Create agent and assess risk
+        from src.agent_core import AgentCore
         agent = AgentCore(cfg)
         risk_assessment = agent.risk_manager.assess_portfolio_risk(cfg.portfolio)
         
+        renderables = []
+        
         # Display risk score
-        risk_level = "Low" if risk_assessment.portfolio_risk_score < 0.3 else "Moderate" if risk_assessment.portfolio_risk_score < 0.7 else "High"
-        risk_color = "green" if risk_assessment.portfolio_risk_score < 0.3 else "yellow" if risk_assessment.portfolio_risk_score < 0.7 else "red"
+        risk_level, risk_color = _risk_bucket(risk_assessment.portfolio_risk_score)
         
-        console.print(Panel(
+        renderables.append(Panel(
             f"[bold {risk_color}]{risk_level}[/bold {risk_color}] ({risk_assessment.portfolio_risk_score:.2%})",
             title="Portfolio Risk",
             border_style=risk_color
         ))
         
-        console.print()
+        renderables.append("")
         
         # Display portfolio positions
-        console.print("[bold]Portfolio Positions:[/bold]")
+        renderables.append("[bold]Portfolio Positions:[/bold]")
         positions_table = Table(box=box.SIMPLE_HEAD)
         positions_table.add_column("Symbol", style="cyan")
         positions_table.add_column("Shares", justify="right")
@@ -1085,33 +1193,32 @@ def portfolio(config: Optional[str]):
                 f"{position.weight:.2%}"
             )
         
-        console.print(positions_table)
-        console.print()
+        renderables.append(positions_table)
+        renderables.append("")
         
         # Display concentration risks
         if risk_assessment.concentration_risks:
-            console.print("[bold yellow]⚠️  Concentration Risks:[/bold yellow]")
-            for risk in risk_assessment.concentration_risks:
-                console.print(f"  • {risk}")
-            console.print()
+            renderables.append("[bold yellow]⚠️  Concentration Risks:[/bold yellow]")
+            renderables.append("\n".join(f"  • {risk}" for risk in risk_assessment.concentration_risks))
+            renderables.append("")
         
         # Display correlation risks
         if risk_assessment.correlation_risks:
-            console.print("[bold yellow]⚠️  Correlation Risks:[/bold yellow]")
-            for risk in risk_assessment.correlation_risks:
-                console.print(f"  • {risk}")
-            console.print()
+            renderables.append("[bold yellow]⚠️  Correlation Risks:[/bold yellow]")
+            renderables.append("\n".join(f"  • {risk}" for risk in risk_assessment.correlation_risks))
+            renderables.append("")
         
         # Display mitigation actions
         if risk_assessment.risk_mitigation_actions:
-            console.print("[bold cyan]💡 Risk Mitigation Recommendations:[/bold cyan]")
-            for action in risk_assessment.risk_mitigation_actions:
-                console.print(f"  • {action}")
-            console.print()
+            renderables.append("[bold cyan]💡 Risk Mitigation Recommendations:[/bold cyan]")
+            renderables.append("\n".join(f"  • {action}" for action in risk_assessment.risk_mitigation_actions))
+            renderables.append("")
         
         # Display disclaimers
-        console.print(display_risk_estimate_clarification())
-        console.print(display_recommendation_disclaimer())
+        renderables.append(display_risk_estimate_clarification())
+        renderables.append(display_recommendation_disclaimer())
+        
+        console.print(Group(*renderables))
         
     except Exception as e:
         console.print(f"[bold red]Unexpected error:[/bold red] {str(e)}", style="red")
@@ -1137,8 +1244,12 @@ def scan(symbols: tuple, config: Optional[str], min_confidence: float, limit: in
         stock-agent scan --hours-back 48 --limit 10
         stock-agent scan --symbols AAPL TSLA GOOGL
     """
+    display_startup_disclaimer()
+    
     try:
         # Load configuration
+        from src.agent_core import AgentCore
+        from src.config import Configuration
         cfg = Configuration.load(config) if config else Configuration()
         agent = AgentCore(cfg)
         
@@ -1153,23 +1264,12 @@ def scan(symbols: tuple, config: Optional[str], min_confidence: float, limit: in
             from src.agent_core import analyze_discovered_stocks, filter_actionable_recommendations
             
             # Create mock discovered stocks for backward compatibility
-            class MockDiscoveredStock:
-                def __init__(self, symbol):
-                    self.symbol = symbol
-                    self.mention_count = 0
-                    self.sources = []
-                    self.sample_articles = []
-            
-            discovered_stocks = [MockDiscoveredStock(s) for s in symbols]
+            discovered_stocks = [_MockDiscoveredStock(s) for s in symbols]
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Analyzing stocks...", total=None)
-                analysis_results = analyze_discovered_stocks(discovered_stocks, agent)
-                progress.update(task, completed=True)
+            with _status("Analyzing stocks...") as status:
+                analysis_results = analyze_discovered_stocks(
+                    discovered_stocks, agent, on_progress=_progress_to(status, "Analyzing stocks...")
+                )
             
             # Filter for actionable recommendations
             actionable_results = filter_actionable_recommendations(analysis_results)
@@ -1185,14 +1285,10 @@ def scan(symbols: tuple, config: Optional[str], min_confidence: float, limit: in
             from src.news_discovery import NewsDiscovery
             from src.agent_core import analyze_discovered_stocks, filter_actionable_recommendations
             
-            # Phase 1: Discover stocks from news
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Fetching and analyzing news...", total=None)
-                
+            # One status line spans discovery and analysis; the discovered
+            # symbols are printed above it between the two phases
+            with _status("Fetching and analyzing news...") as status:
+                # Phase 1: Discover stocks from news
                 discovery = NewsDiscovery(
                     data_provider=agent.data_provider,
                     symbol_lookup=SymbolLookup(),
@@ -1200,43 +1296,41 @@ def scan(symbols: tuple, config: Optional[str], min_confidence: float, limit: in
                 )
                 
                 discovered_stocks = discovery.discover_stocks(hours_back=hours_back)
-                progress.update(task, completed=True)
-            
-            console.print()
-            console.print(f"[green]✓[/green] Discovered {len(discovered_stocks)} stocks from news")
-            
-            # Display discovered symbols
-            if discovered_stocks:
-                console.print("\n[bold]Discovered Symbols:[/bold]")
-                symbols_table = Table(box=box.SIMPLE_HEAD)
-                symbols_table.add_column("Symbol", style="cyan")
-                symbols_table.add_column("Mentions", justify="right")
-                symbols_table.add_column("Sources", justify="right")
                 
-                for stock in discovered_stocks[:10]:  # Show top 10
-                    symbols_table.add_row(
-                        stock.symbol,
-                        str(stock.mention_count),
-                        str(len(stock.sources))
-                    )
+                renderables = [""]
+                renderables.append(f"[green]✓[/green] Discovered {len(discovered_stocks)} stocks from news")
                 
-                if len(discovered_stocks) > 10:
-                    symbols_table.add_row("...", "...", "...")
+                # Display discovered symbols
+                if discovered_stocks:
+                    renderables.append("\n[bold]Discovered Symbols:[/bold]")
+                    symbols_table = Table(box=box.SIMPLE_HEAD)
+                    symbols_table.add_column("Symbol", style="cyan")
+                    symbols_table.add_column("Mentions", justify="right")
+                    symbols_table.add_column("Sources", justify="right")
+                    
+                    for stock in discovered_stocks[:10]:  # Show top 10
+                        symbols_table.add_row(
+                            stock.symbol,
+                            str(stock.mention_count),
+                            str(len(stock.sources))
+                        )
+                    
+                    if len(discovered_stocks) > 10:
+                        symbols_table.add_row("...", "...", "...")
+                    
+                    renderables.append(symbols_table)
+                    renderables.append("")
                 
-                console.print(symbols_table)
-                console.print()
-            
-            # Phase 2: Analyze discovered stocks
-            console.print("[bold cyan]Analyzing discovered stocks...[/bold cyan]\n")
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Running analysis pipeline...", total=None)
-                analysis_results = analyze_discovered_stocks(discovered_stocks, agent)
-                progress.update(task, completed=True)
+                # Phase 2: Analyze discovered stocks
+                renderables.append("[bold cyan]Analyzing discovered stocks...[/bold cyan]\n")
+                console.print(Group(*renderables))
+                
+                if status is not None:
+                    status.update("Running analysis pipeline...")
+                
+                analysis_results = analyze_discovered_stocks(
+                    discovered_stocks, agent, on_progress=_progress_to(status, "Running analysis pipeline...")
+                )
             
             console.print()
             console.print(f"[green]✓[/green] Analyzed {len(analysis_results)} stocks successfully")
@@ -1245,9 +1339,11 @@ def scan(symbols: tuple, config: Optional[str], min_confidence: float, limit: in
             # Phase 3: Filter for actionable recommendations
             actionable_results = filter_actionable_recommendations(analysis_results, discovered_stocks)
         
+        renderables = []
+        
         # Display results
         if not actionable_results:
-            console.print(Panel(
+            renderables.append(Panel(
                 f"[yellow]No actionable recommendations found (BUY/SELL with confidence >= {min_confidence:.0%})[/yellow]\n\n"
                 f"Try lowering the minimum confidence threshold with --min-confidence 0.5",
                 title="⚠️  No Opportunities Found",
@@ -1261,7 +1357,7 @@ def scan(symbols: tuple, config: Optional[str], min_confidence: float, limit: in
             ]
             
             if not filtered_results:
-                console.print(Panel(
+                renderables.append(Panel(
                     f"[yellow]No recommendations found with confidence >= {min_confidence:.0%}[/yellow]\n\n"
                     f"Found {len(actionable_results)} actionable recommendations with lower confidence.\n"
                     f"Try lowering the threshold with --min-confidence 0.5",
@@ -1272,79 +1368,67 @@ def scan(symbols: tuple, config: Optional[str], min_confidence: float, limit: in
                 # Limit results
                 filtered_results = filtered_results[:limit]
                 
-                console.print(Panel(
+                renderables.append(Panel(
                     f"[bold green]Found {len(filtered_results)} actionable recommendation(s)[/bold green]",
                     title="✅ Top Stock Recommendations",
                     border_style="green"
                 ))
-                console.print()
+                renderables.append("")
+                
+                mentions_by_symbol = {stock.symbol: stock.mention_count for stock in discovered_stocks}
                 
                 # Display each opportunity
                 for i, result in enumerate(filtered_results, 1):
                     symbol = result.symbol
                     rec = result.recommendation
                     
-                    # Determine action color
-                    action_color = "green" if rec.action == "BUY" else "red"
-                    
-                    console.print(f"[bold cyan]{i}. {symbol}[/bold cyan]")
-                    
                     # Create summary table
-                    summary_table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
-                    summary_table.add_row("Action:", f"[bold {action_color}]{rec.action}[/bold {action_color}]")
-                    summary_table.add_row("Confidence:", f"{rec.confidence:.0%}")
+                    summary_rows = [
+                        ("Action:", Text.assemble((rec.action, _ACTION_STYLE.get(rec.action, _DEFAULT_ACTION_STYLE)))),
+                        ("Confidence:", f"{rec.confidence:.0%}")
+                    ]
                     
                     # Get mention count if available
-                    mention_count = 0
                     if not symbols:  # Only show mentions for news-driven discovery
-                        for stock in discovered_stocks:
-                            if stock.symbol == symbol:
-                                mention_count = stock.mention_count
-                                break
+                        mention_count = mentions_by_symbol.get(symbol, 0)
                         if mention_count > 0:
-                            summary_table.add_row("News Mentions:", str(mention_count))
+                            summary_rows.append(("News Mentions:", str(mention_count)))
                     
-                    if rec.entry_price_low and rec.entry_price_high:
-                        summary_table.add_row(
-                            "Entry Range:",
-                            f"${rec.entry_price_low:.2f} - ${rec.entry_price_high:.2f}"
-                        )
-                    
-                    if rec.exit_price_low and rec.exit_price_high:
-                        summary_table.add_row(
-                            "Exit Range:",
-                            f"${rec.exit_price_low:.2f} - ${rec.exit_price_high:.2f}"
-                        )
-                    
-                    summary_table.add_row("Sentiment:", f"{result.sentiment.sentiment_score:+.2f} ({len(result.sentiment.sources)} sources)")
-                    summary_table.add_row("Technical:", f"{result.technical.technical_score:+.2f} (RSI: {result.technical.rsi:.1f})")
-                    summary_table.add_row("Fundamental:", f"{result.fundamental.fundamental_score:+.2f}")
+                    summary_rows.extend(_price_range_rows(rec))
+                    summary_rows.extend((
+                        ("Sentiment:", f"{result.sentiment.sentiment_score:+.2f} ({len(result.sentiment.sources)} sources)"),
+                        ("Technical:", f"{result.technical.technical_score:+.2f} (RSI: {result.technical.rsi:.1f})"),
+                        ("Fundamental:", f"{result.fundamental.fundamental_score:+.2f}")
+                    ))
                     
-                    console.print(summary_table)
+                    summary_table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
+                    for row in summary_rows:
+                        summary_table.add_row(*row)
                     
-                    # Show plain English summary
-                    console.print(Panel(
-                        _generate_plain_english_summary(result),
-                        border_style="cyan",
-                        padding=(0, 1)
+                    # Heading, summary table and plain English summary as one block
+                    renderables.append(Group(
+                        Text.assemble((f"{i}. {symbol}", _HEADING_STYLE)),
+                        summary_table,
+                        _summary_panel(result)
                     ))
                     
                     if i < len(filtered_results):
-                        console.print()
+                        renderables.append("")
                 
                 # Display summary
-                console.print()
-                console.print(f"[dim]Summary: Discovered {len(discovered_stocks) if not symbols else len(symbols)} stocks, "
-                             f"analyzed {len(analysis_results)}, found {len(actionable_results)} actionable recommendations[/dim]")
+                renderables.append("")
+                renderables.append(f"[dim]Summary: Discovered {len(discovered_stocks) if not symbols else len(symbols)} stocks, "
+                                  f"analyzed {len(analysis_results)}, found {len(actionable_results)} actionable recommendations[/dim]")
         
         # Display disclaimers
-        console.print()
-        console.print(display_recommendation_disclaimer())
-        console.print(display_past_performance_warning())
+        renderables.append("")
+        renderables.append(display_recommendation_disclaimer())
+        renderables.append(display_past_performance_warning())
+        
+        console.print(Group(*renderables))
         
     except Exception as e:
         console.print(f"[bold red]Unexpected error:[/bold red] {str(e)}", style="red")
-        import traceback
         console.print(f"[dim]{traceback.format_exc()}[/dim]")
         console.print("\n[dim]Please check your configuration and try again.[/dim]")
         sys.exit(1)
@@ -1370,6 +1454,7 @@ def close_trade(trade_id: str, exit_price: float, config: Optional[str], notes:
         console.print(f"\n[bold cyan]Closing trade {trade_id}...[/bold cyan]\n")
         
         # Load configuration
+        from src.config import Configuration
         cfg = Configuration.load(config) if config else Configuration()
         
         if not cfg.performance_tracking_enabled:
@@ -1377,8 +1462,8 @@ def close_trade(trade_id: str, exit_price: float, config: Optional[str], notes:
             sys.exit(0)
         
         # Initialize performance tracker
-        from src.performance_tracker import PerformanceTracker
-        tracker = PerformanceTracker(cfg.performance_storage_path)
+        from src.performance_tracker import get_tracker
+        tracker = get_tracker(cfg.performance_storage_path)
         
         # Close the trade
         trade = tracker.record_exit(trade_id, exit_price, notes)
@@ -1434,6 +1519,7 @@ def performance(config: Optional[str], month: Optional[int], year: Optional[int]
         console.print("\n[bold cyan]Generating Performance Report...[/bold cyan]\n")
         
         # Load configuration
+        from src.config import Configuration
         cfg = Configuration.load(config) if config else Configuration()
         
         if not cfg.performance_tracking_enabled:
@@ -1441,23 +1527,24 @@ def performance(config: Optional[str], month: Optional[int], year: Optional[int]
             sys.exit(0)
         
         # Initialize performance tracker
-        from src.performance_tracker import PerformanceTracker
-        tracker = PerformanceTracker(cfg.performance_storage_path)
+        from src.performance_tracker import get_tracker
+        tracker = get_tracker(cfg.performance_storage_path)
         
         # Generate report
         report = tracker.generate_monthly_report(month, year)
         
         # Display report
+        renderables = []
         period_str = f"{report.period_start[:7]} to {report.period_end[:7]}"
-        console.print(Panel(
+        renderables.append(Panel(
             f"[bold]Performance Report[/bold]\n{period_str}",
             border_style="cyan"
         ))
         
-        console.print()
+        renderables.append("")
         
         # Overall metrics
-        console.print("[bold]📊 Overall Performance[/bold]")
+        renderables.append("[bold]📊 Overall Performance[/bold]")
         overall_table = Table(show_header=False, box=box.SIMPLE)
         overall_table.add_row("Total Trades:", str(report.total_trades))
         overall_table.add_row("Open Trades:", str(report.open_trades))
@@ -1465,37 +1552,37 @@ def performance(config: Optional[str], month: Optional[int], year: Optional[int]
         overall_table.add_row("Winning Trades:", f"[green]{report.winning_trades}[/green]")
         overall_table.add_row("Losing Trades:", f"[red]{report.losing_trades}[/red]")
         
-        win_rate_color = "green" if report.win_rate >= 60 else "yellow" if report.win_rate >= 50 else "red"
+        win_rate_color = _band_color(report.win_rate, _WIN_RATE_BANDS)
         overall_table.add_row("Win Rate:", f"[{win_rate_color}]{report.win_rate:.1f}%[/{win_rate_color}]")
         
         pl_color = "green" if report.total_profit_loss > 0 else "red"
         overall_table.add_row("Total P/L:", f"[{pl_color}]{report.total_profit_loss:+.2f}%[/{pl_color}]")
         overall_table.add_row("Avg P/L:", f"[{pl_color}]{report.avg_profit_loss:+.2f}%[/{pl_color}]")
         
-        console.print(overall_table)
-        console.print()
+        renderables.append(overall_table)
+        renderables.append("")
         
         # Best and worst trades
         if report.best_trade:
-            console.print("[bold]🏆 Best Trade[/bold]")
+            renderables.append("[bold]🏆 Best Trade[/bold]")
             best_table = Table(show_header=False, box=box.SIMPLE)
             best_table.add_row("Symbol:", report.best_trade['symbol'])
             best_table.add_row("P/L:", f"[green]{report.best_trade['profit_loss_percent']:+.2f}%[/green]")
             best_table.add_row("Date:", f"{report.best_trade['entry_date'][:10]} → {report.best_trade['exit_date'][:10]}")
-            console.print(best_table)
-            console.print()
+            renderables.append(best_table)
+            renderables.append("")
         
         if report.worst_trade:
-            console.print("[bold]📉 Worst Trade[/bold]")
+            renderables.append("[bold]📉 Worst Trade[/bold]")
             worst_table = Table(show_header=False, box=box.SIMPLE)
             worst_table.add_row("Symbol:", report.worst_trade['symbol'])
             worst_table.add_row("P/L:", f"[red]{report.worst_trade['profit_loss_percent']:+.2f}%[/red]")
             worst_table.add_row("Date:", f"{report.worst_trade['entry_date'][:10]} → {report.worst_trade['exit_date'][:10]}")
-            console.print(worst_table)
-            console.print()
+            renderables.append(worst_table)
+            renderables.append("")
         
         # Module performance
-        console.print("[bold]🔍 Module Performance Analysis[/bold]")
+        renderables.append("[bold]🔍 Module Performance Analysis[/bold]")
         module_table = Table(box=box.SIMPLE_HEAD)
         module_table.add_column("Module", style="cyan")
         module_table.add_column("Trades", justify="right")
@@ -1505,35 +1592,36 @@ def performance(config: Optional[str], month: Optional[int], year: Optional[int]
         module_table.add_column("Weight", justify="right")
         
         for module_name, perf in report.module_performance.items():
-            win_rate_color = "green" if perf.win_rate >= 60 else "yellow" if perf.win_rate >= 50 else "red"
+            win_rate_color = _band_color(perf.win_rate, _WIN_RATE_BANDS)
             pl_color = "green" if perf.avg_profit_loss > 0 else "red"
-            accuracy_color = "green" if perf.accuracy_score >= 0.7 else "yellow" if perf.accuracy_score >= 0.5 else "red"
+            accuracy_color = _band_color(perf.accuracy_score, _ACCURACY_BANDS)
             
             module_table.add_row(
                 module_name.capitalize(),
                 str(perf.total_trades),
-                f"[{win_rate_color}]{perf.win_rate:.1f}%[/{win_rate_color}]",
-                f"[{pl_color}]{perf.avg_profit_loss:+.2f}%[/{pl_color}]",
-                f"[{accuracy_color}]{perf.accuracy_score:.2f}[/{accuracy_color}]",
+                Text.assemble((f"{perf.win_rate:.1f}%", win_rate_color)),
+                Text.assemble((f"{perf.avg_profit_loss:+.2f}%", pl_color)),
+                Text.assemble((f"{perf.accuracy_score:.2f}", accuracy_color)),
                 f"{perf.recommended_weight:.2f}"
             )
         
-        console.print(module_table)
-        console.print()
+        renderables.append(module_table)
+        renderables.append("")
         
         # Recommended weights
-        console.print("[bold]⚖️  Recommended Weights for Next Period[/bold]")
+        renderables.append("[bold]⚖️  Recommended Weights for Next Period[/bold]")
         weights_table = Table(show_header=False, box=box.SIMPLE)
         for module_name, weight in report.recommended_weights.items():
             weights_table.add_row(f"{module_name.capitalize()}:", f"{weight:.2f} ({weight*100:.0f}%)")
-        console.print(weights_table)
+        renderables.append(weights_table)
         
-        console.print()
-        console.print("[dim]💡 Tip: Enable auto_adjust_weights in config to automatically apply these weights.[/dim]")
+        renderables.append("")
+        renderables.append("[dim]💡 Tip: Enable auto_adjust_weights in config to automatically apply these weights.[/dim]")
+        
+        console.print(Group(*renderables))
         
     except Exception as e:
         console.print(f"[bold red]Unexpected error:[/bold red] {str(e)}", style="red")
-        import traceback
         console.print(f"[dim]{traceback.format_exc()}[/dim]")
         sys.exit(1)
 
@@ -1551,6 +1639,7 @@ def open_trades(config: Optional[str]):
         console.print("\n[bold cyan]Open Trades[/bold cyan]\n")
         
         # Load configuration
+        from src.config import Configuration
         cfg = Configuration.load(config) if config else Configuration()
         
         if not cfg.performance_tracking_enabled:
@@ -1558,8 +1647,8 @@ def open_trades(config: Optional[str]):
             sys.exit(0)
         
         # Initialize performance tracker
-        from src.performance_tracker import PerformanceTracker
-        tracker = PerformanceTracker(cfg.performance_storage_path)
+        from src.performance_tracker import get_tracker
+        tracker = get_tracker(cfg.performance_storage_path)
         
         # Get open trades
         trades = tracker.get_open_trades()
@@ -1578,25 +1667,27 @@ def open_trades(config: Optional[str]):
         trades_table.add_column("Entry Date")
         trades_table.add_column("Days Held", justify="right")
         
+        now = datetime.now()
         for trade in trades:
-            entry_date = datetime.fromisoformat(trade.entry_date)
-            days_held = (datetime.now() - entry_date).days
+            days_held = (now - datetime.fromisoformat(trade.entry_date)).days
             
             action_color = "green" if trade.action == "BUY" else "red"
             
             trades_table.add_row(
                 trade.trade_id,
                 trade.symbol,
-                f"[{action_color}]{trade.action}[/{action_color}]",
+                Text.assemble((trade.action, action_color)),
                 f"${trade.entry_price:.2f}",
                 str(trade.quantity),
                 trade.entry_date[:10],
                 str(days_held)
             )
         
-        console.print(trades_table)
-        console.print()
-        console.print(f"[dim]Total: {len(trades)} open trade(s)[/dim]")
+        console.print(Group(
+            trades_table,
+            "",
+            f"[dim]Total: {len(trades)} open trade(s)[/dim]",
+        ))
         
     except Exception as e:
         console.print(f"[bold red]Unexpected error:[/bold red] {str(e)}", style="red")
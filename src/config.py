@@ -1,12 +1,53 @@
 """Configuration management for Stock Market AI Agent."""
 
+import copy
 import json
+import math
 import os
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
+
+# (api_keys entry, environment variable) pairs filled in by Configuration
+_ENV_KEYS = (
+    ('news_api', 'NEWS_API_KEY'),
+    ('alpha_vantage', 'ALPHA_VANTAGE_API_KEY'),
+    ('twitter', 'TWITTER_API_KEY'),
+    ('reddit', 'REDDIT_API_KEY'),
+    ('finnhub', 'FINNHUB_API_KEY'),
+)
+
+
+@lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """Load variables from a .env file into the environment, once per process."""
+    load_dotenv()
+
+
+@lru_cache(maxsize=8)
+def _read_config_file(resolved_path: str, mtime_ns: int) -> dict:
+    """Parse a configuration file, memoised by path and modification time.
+    
+    Args:
+        resolved_path: Absolute path of the configuration file
+        mtime_ns: File modification time, so edits invalidate the cached entry
+        
+    Returns:
+        Parsed JSON data (shared; callers must not mutate it)
+    """
+    raw = Path(resolved_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 @dataclass
 class Configuration:
@@ -38,26 +79,17 @@ class Configuration:
     
     def __post_init__(self):
         """Load API keys from environment variables if not provided."""
-        load_dotenv()
+        _load_dotenv_once()
         
         # Load API keys from environment if not already set
-        env_keys = {
-            'news_api': 'NEWS_API_KEY',
-            'alpha_vantage': 'ALPHA_VANTAGE_API_KEY',
-            'twitter': 'TWITTER_API_KEY',
-            'reddit': 'REDDIT_API_KEY',
-            'finnhub': 'FINNHUB_API_KEY',
-        }
-        
-        for key_name, env_var in env_keys.items():
-            if key_name not in self.api_keys or not self.api_keys[key_name]:
+        for key_name, env_var in _ENV_KEYS:
+            if not self.api_keys.get(key_name):
                 env_value = os.getenv(env_var)
                 if env_value:
                     self.api_keys[key_name] = env_value
         
-        # Also check for direct finnhub_api_key attribute
-        if not hasattr(self, 'finnhub_api_key') or not self.finnhub_api_key:
-            self.finnhub_api_key = os.getenv('FINNHUB_API_KEY', self.api_keys.get('finnhub', ''))
+        # Direct attribute used by the Finnhub clients; the environment wins
+        self.finnhub_api_key = os.getenv('FINNHUB_API_KEY', self.api_keys.get('finnhub', ''))
     
     @classmethod
     def load(cls, config_path: str = "config.json") -> "Configuration":
@@ -75,14 +107,36 @@ class Configuration:
         """
         path = Path(config_path)
         
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             # Return default configuration if file doesn't exist
             return cls()
         
-        with open(path, 'r') as f:
-            data = json.load(f)
+        # Reuse the parsed file until it changes; copy it so each instance
+        # gets its own api_keys dict to fill in and mutate
+        data = _read_config_file(str(path.resolve()), stat.st_mtime_ns)
         
-        return cls(**data)
+        return cls(**copy.deepcopy(data))
+    
+    def to_dict(self) -> dict:
+        """Convert the configuration to a JSON-serialisable dictionary.
+        
+        Returns:
+            Dictionary of the configuration fields
+        """
+        return {
+            'api_keys': dict(self.api_keys),
+            'risk_tolerance': self.risk_tolerance,
+            'sentiment_weight': self.sentiment_weight,
+            'technical_weight': self.technical_weight,
+            'fundamental_weight': self.fundamental_weight,
+            'cache_ttl_seconds': self.cache_ttl_seconds,
+            'performance_tracking_enabled': self.performance_tracking_enabled,
+            'performance_storage_path': self.performance_storage_path,
+            'auto_adjust_weights': self.auto_adjust_weights,
+            'min_trades_for_adjustment': self.min_trades_for_adjustment,
+        }
     
     def save(self, config_path: str = "config.json") -> None:
         """Save configuration to a JSON file.
@@ -95,8 +149,11 @@ class Configuration:
         # Create parent directories if they don't exist
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w') as f:
-            json.dump(asdict(self), f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
     
     def validate_weights(self) -> bool:
         """Validate that analysis weights are in valid range [0.0, 1.0].
@@ -109,14 +166,18 @@ class Configuration:
     
     def normalize_weights(self) -> None:
         """Normalize analysis weights to sum to 1.0."""
-        total = self.sentiment_weight + self.technical_weight + self.fundamental_weight
+        total = math.fsum((self.sentiment_weight, self.technical_weight, self.fundamental_weight))
+        
+        if abs(total - 1.0) < 1e-9:
+            # Already normalized; dividing would only add rounding drift
+            return
         
         if total == 0:
             # If all weights are 0, set to default
             self.sentiment_weight = 0.5
             self.technical_weight = 0.3
             self.fundamental_weight = 0.2
-        elif total != 1.0:
+        else:
             # Normalize to sum to 1.0
             self.sentiment_weight /= total
             self.technical_weight /= total
@@ -2,20 +2,54 @@
 
 import time
 import os
+import random
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 
-from cachetools import TTLCache
+from cachetools import TLRUCache
 import yfinance as yf
 
 from .models import StockData, PricePoint
 from .config import Configuration
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Minimum cache lifetime in seconds by data kind (the cache key prefix).
+# Financials change with quarterly filings, so they outlive price and news data.
+_MIN_CACHE_TTL = {'financials': 3600}
+
+
+class InsufficientDataError(ValueError):
+    """Raised when a symbol is invalid or has too little data to analyze."""
+    pass
+
+
+def parse_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+    
+    Args:
+        response: HTTP response with a JSON body
+        
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class NewsArticle:
     """Represents a news article."""
@@ -25,6 +59,11 @@ class NewsArticle:
         self.content = content
         self.url = url
         self.published_at = published_at
+    
+    @cached_property
+    def title_words(self) -> frozenset:
+        """Lowercased words of the title, computed on first use."""
+        return frozenset(self.title.lower().split())
 
 
 class SocialPost:
@@ -67,6 +106,10 @@ class CompanyFinancials:
 class DataProvider:
     """Provides market data from external APIs with caching and retry logic."""
     
+    # Worker threads for news fetches. Each get_news call queries 3 sources
+    # at once, so this covers 8 stocks fetching news concurrently.
+    MAX_NEWS_WORKERS = 24
+    
     def __init__(self, config: Configuration):
         """Initialize the data provider.
         
@@ -74,9 +117,106 @@ class DataProvider:
             config: Configuration object with API keys and settings
         """
         self.config = config
-        self.cache = TTLCache(maxsize=100, ttl=config.cache_ttl_seconds)
+        self.cache = TLRUCache(maxsize=100, ttu=self._cache_expiry)
+        # TLRUCache is not thread-safe and fetches may run concurrently
+        self._cache_lock = threading.Lock()
+        # In-flight ticker.info fetches by symbol, so concurrent callers for
+        # the same symbol share one request; entries are removed when done
+        self._info_in_flight: Dict[str, Future] = {}
+        # History from prefetch_history, kept out of the size-bounded cache so
+        # a large batch isn't evicted before use; entries are removed on read
+        self._prefetched_history: Dict[str, Any] = {}
         self.max_retries = 3
         self.base_delay = 1.0  # Base delay for exponential backoff in seconds
+        
+        # Shared session so HTTP calls reuse pooled TCP/TLS connections.
+        # Retries are handled by _retry_with_backoff, not by the adapter.
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'StockMarketAIAgent/1.0'})
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Long-lived pool for news fetches instead of creating threads per call
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_NEWS_WORKERS,
+            thread_name_prefix='data-provider'
+        )
+    
+    def close(self) -> None:
+        """Shut down the news worker pool and close pooled HTTP connections."""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+    
+    def _cache_expiry(self, cache_key: str, value: Any, now: float) -> float:
+        """Get the time a cache entry expires, from its data kind.
+        
+        Args:
+            cache_key: Cache key, prefixed with the data kind (e.g. "news_")
+            value: Cached value (unused)
+            now: Current cache timer value
+            
+        Returns:
+            Expiry time on the cache timer
+        """
+        kind = cache_key.split('_', 1)[0]
+        return now + max(self.config.cache_ttl_seconds, _MIN_CACHE_TTL.get(kind, 0))
+    
+    def _get_cached(self, cache_key: str) -> Any:
+        """Return a cached value, or None if missing or expired."""
+        with self._cache_lock:
+            return self.cache.get(cache_key)
+    
+    def _set_cached(self, cache_key: str, value: Any) -> None:
+        """Store a value in the cache."""
+        with self._cache_lock:
+            self.cache[cache_key] = value
+    
+    def _get_info(self, symbol: str) -> Dict[str, Any]:
+        """Get a symbol's yfinance info, fetching it once for all callers.
+        
+        get_stock_data and get_company_financials both need the info dict
+        and usually run concurrently, so a caller arriving while a fetch for
+        the same symbol is in flight waits for it instead of making a second
+        request. No lock is held during the request itself. Only
+        info with a price is cached; an empty or partial (throttled)
+        response is returned as is and fetched again next time.
+        
+        Args:
+            symbol: Stock ticker symbol
+            
+        Returns:
+            The ticker's info dictionary (shared; callers must not mutate it)
+        """
+        cache_key = f"info_{symbol}"
+        
+        with self._cache_lock:
+            info = self.cache.get(cache_key)
+            if info is not None:
+                return info
+            in_flight = self._info_in_flight.get(symbol)
+            if in_flight is None:
+                future = self._info_in_flight[symbol] = Future()
+        
+        if in_flight is not None:
+            # Another caller is fetching this symbol; share its result
+            return in_flight.result()
+        
+        try:
+            info = yf.Ticker(symbol).info
+        except Exception as e:
+            with self._cache_lock:
+                del self._info_in_flight[symbol]
+            future.set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            if info and ('regularMarketPrice' in info or 'currentPrice' in info):
+                self.cache[cache_key] = info
+            del self._info_in_flight[symbol]
+        future.set_result(info)
+        
+        return info
     
     def _retry_with_backoff(self, func, *args, **kwargs):
         """Execute a function with exponential backoff retry logic.
@@ -90,6 +230,8 @@ class DataProvider:
             Result of the function call
             
         Raises:
+            InsufficientDataError: Immediately, without retrying, for invalid
+                or insufficient data, which another attempt won't fix
             Exception: If all retry attempts fail
         """
         last_exception = None
@@ -97,13 +239,16 @@ class DataProvider:
         for attempt in range(self.max_retries):
             try:
                 return func(*args, **kwargs)
+            except InsufficientDataError:
+                raise
             except Exception as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
-                    delay = self.base_delay * (2 ** attempt)
+                    # Jitter so concurrent fetches don't retry in lockstep
+                    delay = self.base_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
                     logger.warning(
                         f"Attempt {attempt + 1} failed: {str(e)}. "
-                        f"Retrying in {delay} seconds..."
+                        f"Retrying in {delay:.1f} seconds..."
                     )
                     time.sleep(delay)
                 else:
@@ -121,47 +266,62 @@ class DataProvider:
             StockData object with current and historical prices
             
         Raises:
-            ValueError: If symbol is invalid
+            InsufficientDataError: If symbol is invalid or lacks history
             Exception: If data retrieval fails after retries
         """
         cache_key = f"stock_data_{symbol}"
         
         # Check cache first
-        if cache_key in self.cache:
+        cached = self._get_cached(cache_key)
+        if cached is not None:
             logger.info(f"Cache hit for {symbol} stock data")
-            return self.cache[cache_key]
+            return cached
         
         logger.info(f"Fetching stock data for {symbol}")
         
         def fetch_data():
-            ticker = yf.Ticker(symbol)
-            
             # Get current data
-            info = ticker.info
-            if not info or 'regularMarketPrice' not in info:
-                raise ValueError(f"Invalid symbol: {symbol}")
+            info = self._get_info(symbol)
+            # Yahoo returns empty info when throttling, so that is retried
+            if not info:
+                raise ValueError(f"No info returned for {symbol}")
+            if 'regularMarketPrice' not in info:
+                raise InsufficientDataError(f"Invalid symbol: {symbol}")
             
             current_price = info.get('regularMarketPrice', info.get('currentPrice', 0))
             volume = info.get('volume', 0)
             
-            # Get historical data (200+ days)
-            hist = ticker.history(period="1y")  # Get 1 year of data
+            # Get historical data (200+ days), reusing a batched download
+            with self._cache_lock:
+                hist = self._prefetched_history.pop(symbol, None)
+            if hist is None:
+                hist = yf.Ticker(symbol).history(period="1y")  # Get 1 year of data
+            else:
+                hist = self._localize_history(hist, info.get('exchangeTimezoneName'))
             
             if hist.empty or len(hist) < 200:
-                raise ValueError(f"Insufficient historical data for {symbol}")
-            
-            # Convert to PricePoint objects
-            historical_prices = []
-            for date, row in hist.iterrows():
-                price_point = PricePoint(
-                    date=date.to_pydatetime(),
-                    open=float(row['Open']),
-                    high=float(row['High']),
-                    low=float(row['Low']),
-                    close=float(row['Close']),
-                    volume=int(row['Volume'])
+                raise InsufficientDataError(f"Insufficient historical data for {symbol}")
+            
+            # Convert to PricePoint objects, reading whole columns at once
+            # rather than boxing every row into a Series with iterrows()
+            historical_prices = [
+                PricePoint(
+                    date=date,
+                    open=float(open_),
+                    high=float(high),
+                    low=float(low),
+                    close=float(close),
+                    volume=int(volume)
+                )
+                for date, open_, high, low, close, volume in zip(
+                    hist.index.to_pydatetime(),
+                    hist['Open'].tolist(),
+                    hist['High'].tolist(),
+                    hist['Low'].tolist(),
+                    hist['Close'].tolist(),
+                    hist['Volume'].tolist(),
                 )
-                historical_prices.append(price_point)
+            ]
             
             stock_data = StockData(
                 symbol=symbol.upper(),
@@ -177,11 +337,73 @@ class DataProvider:
         stock_data = self._retry_with_backoff(fetch_data)
         
         # Cache the result
-        self.cache[cache_key] = stock_data
+        self._set_cached(cache_key, stock_data)
         logger.info(f"Cached stock data for {symbol}")
         
         return stock_data
     
+    @staticmethod
+    def _localize_history(hist: Any, timezone: Optional[str]) -> Any:
+        """Put a batch-downloaded history index in the exchange's timezone.
+        
+        yf.download may return a timezone-naive index where Ticker.history
+        returns one in the exchange's timezone, so price dates would depend
+        on which path fetched them.
+        
+        Args:
+            hist: History frame from yf.download
+            timezone: Exchange timezone name from the ticker info, if known
+            
+        Returns:
+            The history frame, indexed like Ticker.history's
+        """
+        if not timezone:
+            return hist
+        if hist.index.tz is None:
+            return hist.tz_localize(timezone)
+        return hist.tz_convert(timezone)
+    
+    def prefetch_history(self, symbols: List[str]) -> None:
+        """Download a year of daily history for several symbols in one batch.
+        
+        get_stock_data uses the prefetched history, once, instead of
+        requesting it per symbol. Symbols the batch download misses are
+        fetched one by one as before, so failures here are only logged.
+        
+        Args:
+            symbols: Stock ticker symbols about to be analyzed
+        """
+        with self._cache_lock:
+            pending = [
+                symbol for symbol in dict.fromkeys(symbols)
+                if self.cache.get(f"stock_data_{symbol}") is None
+                and symbol not in self._prefetched_history
+            ]
+        if len(pending) < 2:
+            return
+        
+        logger.info(f"Prefetching history for {len(pending)} symbols")
+        
+        try:
+            # Adjusted prices, as Ticker.history returns; older yfinance
+            # versions default download() to unadjusted closes
+            data = yf.download(
+                pending, period="1y", group_by="ticker", auto_adjust=True,
+                actions=False, threads=True, progress=False
+            )
+        except Exception as e:
+            logger.warning(f"Batch history download failed: {str(e)}")
+            return
+        
+        for symbol in pending:
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            # Rows are aligned across symbols; drop days this one didn't trade
+            hist = data[symbol].dropna()
+            if not hist.empty:
+                with self._cache_lock:
+                    self._prefetched_history[symbol] = hist
+    
     def get_news(self, symbol: str, days: int = 7) -> List[NewsArticle]:
         """Fetch news articles for a stock from multiple sources.
         
@@ -200,25 +422,23 @@ class DataProvider:
         cache_key = f"news_{symbol}_{days}"
         
         # Check cache first
-        if cache_key in self.cache:
+        cached = self._get_cached(cache_key)
+        if cached is not None:
             logger.info(f"Cache hit for {symbol} news")
-            return self.cache[cache_key]
+            return cached
         
         logger.info(f"Fetching news for {symbol} from multiple sources")
         
-        all_articles = []
-        
-        # Fetch from Yahoo Finance
-        yahoo_articles = self._fetch_yahoo_news(symbol, days)
-        all_articles.extend(yahoo_articles)
+        # The sources are independent network calls, so fetch them
+        # concurrently; each fetcher handles its own errors and missing keys
+        f_yahoo = self._executor.submit(self._fetch_yahoo_news, symbol, days)
+        f_finnhub = self._executor.submit(self._fetch_finnhub_news, symbol, days)
+        f_newsapi = self._executor.submit(self._fetch_newsapi_news, symbol, days)
+        yahoo_articles = f_yahoo.result()
+        finnhub_articles = f_finnhub.result()
+        newsapi_articles = f_newsapi.result()
         
-        # Fetch from Finnhub if API key is available
-        finnhub_articles = self._fetch_finnhub_news(symbol, days)
-        all_articles.extend(finnhub_articles)
-        
-        # Fetch from NewsAPI if API key is available
-        newsapi_articles = self._fetch_newsapi_news(symbol, days)
-        all_articles.extend(newsapi_articles)
+        all_articles = yahoo_articles + finnhub_articles + newsapi_articles
         
         # Remove duplicates based on title similarity
         unique_articles = self._deduplicate_articles(all_articles)
@@ -227,7 +447,7 @@ class DataProvider:
                    f"(Yahoo: {len(yahoo_articles)}, Finnhub: {len(finnhub_articles)}, NewsAPI: {len(newsapi_articles)})")
         
         # Cache the result
-        self.cache[cache_key] = unique_articles
+        self._set_cached(cache_key, unique_articles)
         
         return unique_articles
     
@@ -244,7 +464,7 @@ class DataProvider:
                     logger.debug(f"No Yahoo Finance news found for {symbol}")
                     return articles
                 
-                cutoff_date = datetime.now()
+                now = datetime.now()
                 
                 for item in news_items:
                     content = item.get('content', {})
@@ -254,11 +474,11 @@ class DataProvider:
                     try:
                         published_at = datetime.fromisoformat(pub_date_str.replace('Z', '+00:00'))
                         published_at = published_at.replace(tzinfo=None)
-                    except:
-                        published_at = datetime.now()
+                    except (AttributeError, TypeError, ValueError):
+                        published_at = now
                     
                     # Filter by date
-                    age_days = (cutoff_date - published_at).days
+                    age_days = (now - published_at).days
                     if age_days > days:
                         continue
                     
@@ -302,8 +522,9 @@ class DataProvider:
             
             try:
                 # Calculate date range
-                end_date = datetime.now().strftime('%Y-%m-%d')
-                start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+                now = datetime.now()
+                end_date = now.strftime('%Y-%m-%d')
+                start_date = (now - timedelta(days=days)).strftime('%Y-%m-%d')
                 
                 # Finnhub company news endpoint
                 url = f"https://finnhub.io/api/v1/company-news"
@@ -314,10 +535,10 @@ class DataProvider:
                     'token': finnhub_key
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
-                    news_items = response.json()
+                    news_items = parse_json_response(response)
                     
                     for item in news_items:
                         # Extract article data
@@ -330,7 +551,7 @@ class DataProvider:
                         if timestamp:
                             published_at = datetime.fromtimestamp(timestamp)
                         else:
-                            published_at = datetime.now()
+                            published_at = now
                         
                         if not headline:
                             continue
@@ -378,8 +599,9 @@ class DataProvider:
             
             try:
                 # Calculate date range
-                end_date = datetime.now().strftime('%Y-%m-%d')
-                start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+                now = datetime.now()
+                end_date = now.strftime('%Y-%m-%d')
+                start_date = (now - timedelta(days=days)).strftime('%Y-%m-%d')
                 
                 # Create search query - remove exchange suffixes for better results
                 search_query = symbol.replace('.NS', '').replace('.BO', '').replace('.', ' ')
@@ -411,10 +633,10 @@ class DataProvider:
                     'pageSize': 100  # Max results
                 }
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = parse_json_response(response)
                     news_items = data.get('articles', [])
                     
                     for item in news_items:
@@ -429,8 +651,8 @@ class DataProvider:
                         try:
                             published_at = datetime.fromisoformat(pub_date_str.replace('Z', '+00:00'))
                             published_at = published_at.replace(tzinfo=None)
-                        except:
-                            published_at = datetime.now()
+                        except (AttributeError, TypeError, ValueError):
+                            published_at = now
                         
                         if not title:
                             continue
@@ -476,30 +698,30 @@ class DataProvider:
             return articles
         
         unique_articles = []
-        seen_titles = set()
+        seen_word_sets = []
+        # Word -> positions in seen_word_sets of titles containing it. Only
+        # titles sharing a word can be similar, so only those are compared.
+        titles_by_word: Dict[str, List[int]] = {}
         
         for article in articles:
-            # Normalize title for comparison (lowercase, remove extra spaces)
-            normalized_title = ' '.join(article.title.lower().split())
-            
-            # Check if we've seen a very similar title
-            is_duplicate = False
-            for seen_title in seen_titles:
-                # Simple similarity check: if titles share 80%+ words, consider duplicate
-                title_words = set(normalized_title.split())
-                seen_words = set(seen_title.split())
-                
-                if len(title_words) > 0 and len(seen_words) > 0:
-                    overlap = len(title_words & seen_words)
-                    similarity = overlap / max(len(title_words), len(seen_words))
-                    
-                    if similarity > 0.8:
-                        is_duplicate = True
-                        break
+            title_words = article.title_words
+            
+            # Count the words shared with each earlier title
+            overlaps = Counter(
+                i for word in title_words for i in titles_by_word.get(word, ())
+            )
+            
+            # Simple similarity check: if titles share 80%+ words, consider duplicate
+            is_duplicate = any(
+                overlap / max(len(title_words), len(seen_word_sets[i])) > 0.8
+                for i, overlap in overlaps.items()
+            )
             
             if not is_duplicate:
                 unique_articles.append(article)
-                seen_titles.add(normalized_title)
+                for word in title_words:
+                    titles_by_word.setdefault(word, []).append(len(seen_word_sets))
+                seen_word_sets.append(title_words)
         
         return unique_articles
     
@@ -522,9 +744,10 @@ class DataProvider:
         cache_key = f"social_{symbol}_{hours}"
         
         # Check cache first
-        if cache_key in self.cache:
+        cached = self._get_cached(cache_key)
+        if cached is not None:
             logger.info(f"Cache hit for {symbol} social media")
-            return self.cache[cache_key]
+            return cached
         
         logger.info(f"Fetching social sentiment for {symbol} from Finnhub")
         
@@ -546,14 +769,10 @@ class DataProvider:
                     'token': finnhub_key
                 }
                 
-                headers = {
-                    'User-Agent': 'StockMarketAIAgent/1.0'
-                }
-                
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = parse_json_response(response)
                     
                     # Finnhub returns aggregated sentiment data
                     # Structure: {"reddit": {...}, "twitter": {...}, "symbol": "AAPL"}
@@ -561,7 +780,8 @@ class DataProvider:
                     reddit_data = data.get('reddit', {})
                     twitter_data = data.get('twitter', {})
                     
-                    cutoff_time = datetime.now() - timedelta(hours=hours)
+                    now = datetime.now()
+                    cutoff_time = now - timedelta(hours=hours)
                     
                     # Process Reddit sentiment
                     if reddit_data:
@@ -578,7 +798,7 @@ class DataProvider:
                                 content=f"Reddit sentiment: {positive_mention} positive, {negative_mention} negative out of {mention} mentions",
                                 author="reddit_aggregate",
                                 url=f"https://reddit.com/r/stocks/search?q={symbol}",
-                                created_at=datetime.now(),
+                                created_at=now,
                                 engagement_score=int(mention * abs(sentiment_score) * 10)
                             )
                             posts.append(post)
@@ -598,7 +818,7 @@ class DataProvider:
                                 content=f"Twitter sentiment: {positive_mention} positive, {negative_mention} negative out of {mention} mentions",
                                 author="twitter_aggregate",
                                 url=f"https://twitter.com/search?q=${symbol}",
-                                created_at=datetime.now(),
+                                created_at=now,
                                 engagement_score=int(mention * abs(sentiment_score) * 10)
                             )
                             posts.append(post)
@@ -633,7 +853,7 @@ class DataProvider:
             posts = []
         
         # Cache the result
-        self.cache[cache_key] = posts
+        self._set_cached(cache_key, posts)
         
         return posts
     
@@ -647,24 +867,24 @@ class DataProvider:
             CompanyFinancials object
             
         Raises:
-            ValueError: If symbol is invalid
             Exception: If data retrieval fails after retries
         """
         cache_key = f"financials_{symbol}"
         
         # Check cache first
-        if cache_key in self.cache:
+        cached = self._get_cached(cache_key)
+        if cached is not None:
             logger.info(f"Cache hit for {symbol} financials")
-            return self.cache[cache_key]
+            return cached
         
         logger.info(f"Fetching financials for {symbol}")
         
         def fetch_financials():
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = self._get_info(symbol)
             
+            # Yahoo returns empty info when throttling, so that is retried
             if not info:
-                raise ValueError(f"Invalid symbol: {symbol}")
+                raise ValueError(f"No info returned for {symbol}")
             
             # Extract financial metrics
             financials = CompanyFinancials(
@@ -686,7 +906,7 @@ class DataProvider:
         financials = self._retry_with_backoff(fetch_financials)
         
         # Cache the result
-        self.cache[cache_key] = financials
+        self._set_cached(cache_key, financials)
         logger.info(f"Cached financials for {symbol}")
         
         return financials
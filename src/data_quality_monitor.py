@@ -6,7 +6,7 @@ tracking issues and automatically adjusting confidence when data is missing.
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -84,16 +84,22 @@ class DataQualityMonitor:
     
     def check_news_availability(
         self,
-        news_sources: List,
-        expected_minimum: int = 3
+        news_sources: Optional[List] = None,
+        expected_minimum: int = 3,
+        total_sources: Optional[int] = None
     ) -> None:
         """Check if sufficient news sources are available.
         
         Args:
             news_sources: List of news sources retrieved
             expected_minimum: Minimum expected number of sources
+            total_sources: Number of sources retrieved, used instead of
+                len(news_sources) when the caller already has the count
         """
-        if len(news_sources) == 0:
+        if total_sources is None:
+            total_sources = len(news_sources) if news_sources else 0
+        
+        if total_sources == 0:
             self.issues.append(DataQualityIssue(
                 source="News Data",
                 severity="critical",
@@ -102,15 +108,15 @@ class DataQualityMonitor:
                 confidence_penalty=0.30
             ))
             logger.error("Critical: No news sources available for sentiment analysis")
-        elif len(news_sources) < expected_minimum:
+        elif total_sources < expected_minimum:
             self.issues.append(DataQualityIssue(
                 source="News Data",
                 severity="major",
-                reason=f"Limited news sources ({len(news_sources)} of {expected_minimum} expected)",
+                reason=f"Limited news sources ({total_sources} of {expected_minimum} expected)",
                 impact="Sentiment confidence reduced due to limited data",
                 confidence_penalty=0.15
             ))
-            logger.warning(f"Major: Only {len(news_sources)} news sources available (expected {expected_minimum})")
+            logger.warning(f"Major: Only {total_sources} news sources available (expected {expected_minimum})")
     
     def check_price_freshness(
         self,
@@ -139,13 +145,13 @@ class DataQualityMonitor:
     def check_indicator_completeness(
         self,
         technical_indicators: dict,
-        required_indicators: List[str]
+        required_indicators: Sequence[str]
     ) -> None:
         """Check if all required technical indicators are available.
         
         Args:
             technical_indicators: Dictionary of available indicators
-            required_indicators: List of required indicator names
+            required_indicators: Sequence of required indicator names
         """
         missing = []
         for indicator in required_indicators:
@@ -177,13 +183,13 @@ class DataQualityMonitor:
     def check_fundamental_completeness(
         self,
         fundamental_metrics: dict,
-        required_metrics: List[str]
+        required_metrics: Sequence[str]
     ) -> None:
         """Check if all required fundamental metrics are available.
         
         Args:
             fundamental_metrics: Dictionary of available metrics
-            required_metrics: List of required metric names
+            required_metrics: Sequence of required metric names
         """
         missing = []
         for metric in required_metrics:
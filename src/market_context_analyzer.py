@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime, timedelta
 import logging
+import threading
 
 from src.data_provider import DataProvider
 
@@ -65,6 +66,8 @@ class MarketContextAnalyzer:
         self._cache: Optional[MarketContext] = None
         self._cache_time: Optional[datetime] = None
         self._cache_duration = timedelta(minutes=15)  # Cache for 15 minutes
+        # Serializes cache refreshes so concurrent analyses share one fetch
+        self._cache_lock = threading.Lock()
     
     def get_market_context(self, use_cache: bool = True) -> MarketContext:
         """
@@ -76,12 +79,22 @@ class MarketContextAnalyzer:
         Returns:
             MarketContext with current market state
         """
-        # Check cache
-        if use_cache and self._cache and self._cache_time:
-            if datetime.now() - self._cache_time < self._cache_duration:
-                logger.info("Using cached market context")
-                return self._cache
+        with self._cache_lock:
+            # Check cache
+            if use_cache and self._cache and self._cache_time:
+                if datetime.now() - self._cache_time < self._cache_duration:
+                    logger.info("Using cached market context")
+                    return self._cache
+            
+            return self._fetch_market_context()
+    
+    def _fetch_market_context(self) -> MarketContext:
+        """
+        Fetch market data and build a fresh market context.
         
+        Returns:
+            MarketContext with current market state
+        """
         logger.info("Fetching fresh market context...")
         
         # Fetch Nifty 50 data
@@ -173,14 +186,13 @@ class MarketContextAnalyzer:
             # Get current price
             current_price = stock_data.current_price
             
-            # Calculate moving averages from historical data
-            if len(stock_data.historical_prices) >= 50:
-                prices = [p.close for p in stock_data.historical_prices[-50:]]
-                ma_20 = sum(prices[-20:]) / 20
-                ma_50 = sum(prices) / 50
-            elif len(stock_data.historical_prices) >= 20:
-                prices = [p.close for p in stock_data.historical_prices[-20:]]
-                ma_20 = sum(prices) / 20
+            # Calculate moving averages from historical closing prices
+            closes = stock_data.close_array
+            if len(closes) >= 50:
+                ma_20 = float(closes[-20:].mean())
+                ma_50 = float(closes[-50:].mean())
+            elif len(closes) >= 20:
+                ma_20 = float(closes[-20:].mean())
                 ma_50 = ma_20  # Fallback to 20DMA if not enough data
             else:
                 # Not enough data, use current price as fallback
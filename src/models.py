@@ -2,8 +2,11 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional, Dict
 
+import numpy as np
+
 
 @dataclass
 class PricePoint:
@@ -63,6 +66,19 @@ class StockData:
             raise ValueError("Current price cannot be negative")
         if self.volume < 0:
             raise ValueError("Volume cannot be negative")
+    
+    @cached_property
+    def close_array(self) -> np.ndarray:
+        """Closing prices from historical_prices as a float64 array.
+        
+        Computed once on first access; historical_prices should not be
+        mutated afterwards.
+        """
+        return np.fromiter(
+            (p.close for p in self.historical_prices),
+            dtype=np.float64,
+            count=len(self.historical_prices)
+        )
 
 
 @dataclass
@@ -182,6 +198,24 @@ class TechnicalIndicators:
         ]
         if self.regime not in valid_regimes:
             raise ValueError(f"Regime must be one of {valid_regimes}")
+    
+    @cached_property
+    def support_floor(self) -> Optional[float]:
+        """Lowest support level, or None if there are none.
+        
+        Computed once on first access; support_levels should not be
+        mutated afterwards.
+        """
+        return min(self.support_levels) if self.support_levels else None
+    
+    @cached_property
+    def resistance_ceiling(self) -> Optional[float]:
+        """Highest resistance level, or None if there are none.
+        
+        Computed once on first access; resistance_levels should not be
+        mutated afterwards.
+        """
+        return max(self.resistance_levels) if self.resistance_levels else None
 
 
 @dataclass
@@ -310,13 +310,16 @@ class NewsDiscovery:
         validated_symbols = []
         invalid_count = 0
         
+        # Build the set of known tickers once rather than per candidate symbol
+        known_symbols = {s.upper() for s in self.symbol_lookup.SYMBOL_MAP.values()}
+        
         for symbol, mention in mentions.items():
             # Check if symbol exists in the registry
             # A symbol is valid if it's in the SYMBOL_MAP values or if it's a known key
             is_valid = False
             
             # Check if it's a value in the map (actual symbol)
-            if symbol.upper() in [s.upper() for s in self.symbol_lookup.SYMBOL_MAP.values()]:
+            if symbol.upper() in known_symbols:
                 is_valid = True
             # Check if it's a key in the map (company name that maps to a symbol)
             elif symbol.lower() in self.symbol_lookup.SYMBOL_MAP:
@@ -8,10 +8,16 @@ import json
 import logging
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import statistics
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -158,8 +164,8 @@ class PerformanceTracker:
             return
         
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
+            raw = self.storage_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # Load trades
             self.trades = [
@@ -208,8 +214,11 @@ class PerformanceTracker:
                 'last_updated': datetime.now().isoformat()
             }
             
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                self.storage_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.storage_path, 'w') as f:
+                    json.dump(data, f, indent=2)
             
             logger.info(f"Saved {len(self.trades)} trades and {len(self.reports)} reports")
             
@@ -645,3 +654,37 @@ class PerformanceTracker:
             List of TradeRecords
         """
         return [t for t in self.trades if t.symbol == symbol]
+
+
+@lru_cache(maxsize=4)
+def _cached_tracker(resolved_path: str, mtime_ns: int) -> PerformanceTracker:
+    """Build a tracker, memoised by storage path and modification time.
+    
+    Args:
+        resolved_path: Absolute path of the JSON storage file
+        mtime_ns: File modification time (0 if missing), so writes invalidate the entry
+        
+    Returns:
+        PerformanceTracker for the storage file
+    """
+    return PerformanceTracker(resolved_path)
+
+
+def get_tracker(storage_path: str = "data/performance.json") -> PerformanceTracker:
+    """Get a performance tracker for a storage file, reusing a loaded one.
+    
+    The tracker is shared until the storage file changes on disk, including
+    through the tracker's own saves, after which the file is read again.
+    
+    Args:
+        storage_path: Path to the JSON storage file
+        
+    Returns:
+        PerformanceTracker for the storage file
+    """
+    path = Path(storage_path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = 0
+    return _cached_tracker(str(path.resolve()), mtime_ns)
@@ -6,14 +6,16 @@ and fundamental analysis results using configured weights.
 
 import numpy as np
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 import logging
 
 from src.models import (
     SentimentData,
     TechnicalIndicators,
     FundamentalMetrics,
-    Recommendation
+    Recommendation,
+    ConfidenceBreakdown,
+    TradeLevels
 )
 from src.config import Configuration
 
@@ -46,6 +48,17 @@ class RecommendationEngine:
             logger.info("Weights don't sum to 1.0, normalizing...")
             self.config.normalize_weights()
     
+    def update_weights(self, weights: Dict[str, float]) -> None:
+        """Update the static analysis weights in place.
+        
+        Weights are applied to the engine's configuration and normalized to
+        sum to 1.0.
+        
+        Args:
+            weights: Dictionary with 'sentiment', 'technical', 'fundamental' keys
+        """
+        self.config.apply_recommended_weights(weights)
+    
     def _get_dynamic_weights(self, market_context: Optional['MarketContext']) -> dict:
         """Get dynamic weights based on market conditions.
         
@@ -277,8 +290,6 @@ class RecommendationEngine:
             
         Validates: Requirements 4.4, 4.7
         """
-        from src.models import ConfidenceBreakdown
-        
         # 1. Determine signal direction from combined score
         if combined_score > 0.3:
             signal_direction = "bullish"
@@ -699,8 +710,6 @@ class RecommendationEngine:
         Returns:
             TradeLevels object with entry, stop loss, target, and risk metrics
         """
-        from src.models import TradeLevels
-        
         if action != "BUY":
             # For now, only calculate trade levels for BUY recommendations
             # SELL levels would be inverse logic
@@ -63,6 +63,9 @@ class ReversalWatch:
 class ReversalWatchDetector:
     """Detects potential reversal setups in oversold stocks with good fundamentals."""
     
+    # Minimum number of price bars needed for the volume spike trigger
+    MIN_VOLUME_BARS = 20
+    
     def __init__(self):
         """Initialize the reversal watch detector."""
         pass
@@ -185,9 +188,8 @@ class ReversalWatchDetector:
         ))
         
         # Trigger 3: Volume spike (current volume > 1.5x average)
-        if len(prices) >= 20:
-            recent_volumes = [p.volume for p in prices[-20:]]
-            avg_volume = sum(recent_volumes) / len(recent_volumes)
+        if len(prices) >= self.MIN_VOLUME_BARS:
+            avg_volume = sum(p.volume for p in prices[-self.MIN_VOLUME_BARS:]) / self.MIN_VOLUME_BARS
             current_volume = prices[-1].volume
             volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
             volume_met = volume_ratio > 1.5
@@ -10,6 +10,28 @@ from src.models import (
 )
 
 
+# Number of most recent closing prices used for volatility
+VOLATILITY_LOOKBACK = 30
+
+
+def calculate_volatility(close_prices: np.ndarray, lookback: int = VOLATILITY_LOOKBACK) -> float:
+    """Calculate volatility as the standard deviation of simple daily returns.
+    
+    Args:
+        close_prices: Closing prices, oldest first
+        lookback: Number of most recent prices to use
+        
+    Returns:
+        Volatility, or 0.0 if there are fewer than two prices
+    """
+    prices = np.asarray(close_prices, dtype=np.float64)[-lookback:]
+    if len(prices) < 2:
+        return 0.0
+    
+    returns = np.diff(prices) / prices[:-1]
+    return float(returns.std())
+
+
 class RiskManager:
     """Manages portfolio risk assessment and position sizing.
     
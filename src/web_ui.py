@@ -104,7 +104,7 @@ def get_action_color(action: str) -> str:
 
 def get_currency_symbol(symbol: str) -> tuple:
     """Get currency symbol and name based on stock symbol."""
-    if symbol.endswith('.NS') or symbol.endswith('.BO'):
+    if symbol.endswith(('.NS', '.BO')):
         return "₹", "INR"
     return "$", "USD"
 
@@ -852,10 +852,10 @@ def analyze_stock_page():
                     st.write(f"**MA-50 (50-day avg):** {currency_symbol}{result.technical.ma_50:.2f}")
                     st.write(f"**MA-200 (200-day avg):** {currency_symbol}{result.technical.ma_200:.2f}")
                 with col2:
-                    if result.technical.support_levels:
-                        st.write(f"**Support (floor):** {currency_symbol}{min(result.technical.support_levels):.2f}")
-                    if result.technical.resistance_levels:
-                        st.write(f"**Resistance (ceiling):** {currency_symbol}{max(result.technical.resistance_levels):.2f}")
+                    if result.technical.support_floor is not None:
+                        st.write(f"**Support (floor):** {currency_symbol}{result.technical.support_floor:.2f}")
+                    if result.technical.resistance_ceiling is not None:
+                        st.write(f"**Resistance (ceiling):** {currency_symbol}{result.technical.resistance_ceiling:.2f}")
             
             # Recent news in expander
             with st.expander(f"📰 Recent News ({len(result.sentiment.sources)} articles)"):
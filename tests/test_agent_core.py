@@ -4,7 +4,12 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
-from src.agent_core import AgentCore, AnalysisError
+from src.agent_core import (
+    AgentCore,
+    AnalysisError,
+    analyze_discovered_stocks,
+    filter_actionable_recommendations
+)
 from src.config import Configuration
 from src.models import (
     StockData,
@@ -84,6 +89,43 @@ class TestAgentCoreInitialization:
         assert agent.fundamental_analyzer is not None
         assert agent.recommendation_engine is not None
         assert agent.risk_manager is not None
+    
+    @patch('src.agent_core.SentimentAnalyzer')
+    def test_performance_tracking_initialized_in_background(self, mock_sent_analyzer, tmp_path):
+        """Test that performance tracking is ready once initialization is awaited."""
+        config = Configuration(
+            performance_storage_path=str(tmp_path / 'performance.json'),
+            auto_adjust_weights=True
+        )
+        
+        agent = AgentCore(config)
+        agent.wait_until_ready()
+        
+        assert agent.performance_tracker is not None
+    
+    @patch('src.agent_core.SentimentAnalyzer')
+    def test_performance_tracker_waits_for_background_init(self, mock_sent_analyzer, tmp_path):
+        """Test that reading performance_tracker right after init waits for it to load."""
+        config = Configuration(
+            performance_storage_path=str(tmp_path / 'performance.json'),
+            auto_adjust_weights=True
+        )
+        
+        agent = AgentCore(config)
+        
+        assert agent.performance_tracker is not None
+    
+    @patch('src.agent_core.PerformanceTracker', side_effect=OSError('unreadable'))
+    @patch('src.agent_core.SentimentAnalyzer')
+    def test_performance_tracking_failure_logged(self, mock_sent_analyzer, mock_tracker, tmp_path):
+        """Test that a tracker load failure leaves tracking disabled instead of raising."""
+        config = Configuration(
+            performance_storage_path=str(tmp_path / 'performance.json')
+        )
+        
+        agent = AgentCore(config)
+        
+        assert agent.performance_tracker is None
 
 
 class TestAnalyzeStock:
@@ -428,6 +470,11 @@ class TestRiskAssessment:
         # Verify risk assessment is present
         assert result.risk_assessment is not None
         assert result.risk_assessment.suggested_position_size == 7.5
+        
+        # Volatility is computed from the last 30 closing prices
+        volatility = risk_manager_instance.suggest_position_size.call_args.kwargs['stock_volatility']
+        assert isinstance(volatility, float)
+        assert volatility > 0
 
 
 class TestErrorHandling:
@@ -447,3 +494,77 @@ class TestErrorHandling:
         # Verify error is raised and logged
         with pytest.raises(AnalysisError, match="Data fetching failed"):
             agent.analyze_stock('AAPL')
+
+
+class TestAnalyzeDiscoveredStocks:
+    """Tests for batch analysis of discovered stocks."""
+    
+    def test_results_preserve_input_order_and_skip_failures(self):
+        """Test that concurrent analysis keeps input order and isolates failures."""
+        def analyze_stock(symbol, portfolio=None):
+            if symbol == 'FAIL':
+                raise AnalysisError("Analysis failed")
+            return Mock(symbol=symbol, recommendation=Mock(action='HOLD'))
+        
+        agent_core = Mock()
+        agent_core.analyze_stock.side_effect = analyze_stock
+        
+        discovered_stocks = [
+            Mock(symbol=symbol, mention_count=1)
+            for symbol in ['AAPL', 'FAIL', 'MSFT', 'TSLA']
+        ]
+        
+        results = analyze_discovered_stocks(discovered_stocks, agent_core, max_workers=4)
+        
+        assert [r.symbol for r in results] == ['AAPL', 'MSFT', 'TSLA']
+        assert agent_core.analyze_stock.call_count == 4
+    
+    def test_progress_reported_for_every_stock(self):
+        """Test that on_progress ticks once per stock, including failures."""
+        def analyze_stock(symbol, portfolio=None):
+            if symbol == 'FAIL':
+                raise AnalysisError("Analysis failed")
+            return Mock(symbol=symbol, recommendation=Mock(action='HOLD'))
+        
+        agent_core = Mock()
+        agent_core.analyze_stock.side_effect = analyze_stock
+        discovered_stocks = [Mock(symbol=symbol, mention_count=1) for symbol in ['AAPL', 'FAIL', 'MSFT']]
+        
+        progress = []
+        analyze_discovered_stocks(
+            discovered_stocks, agent_core, max_workers=2,
+            on_progress=lambda done, total: progress.append((done, total))
+        )
+        
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+    
+    def test_empty_input(self):
+        """Test that an empty discovery list returns no results."""
+        agent_core = Mock()
+        
+        assert analyze_discovered_stocks([], agent_core) == []
+        agent_core.analyze_stock.assert_not_called()
+
+
+class TestFilterActionableRecommendations:
+    """Tests for filtering and ordering actionable recommendations."""
+    
+    def test_excludes_hold_and_sorts_by_confidence_then_mentions(self):
+        """Test HOLD removal and confidence/mention-count ordering."""
+        def make_result(symbol, action, confidence):
+            return Mock(symbol=symbol, recommendation=Mock(action=action, confidence=confidence))
+        
+        results = [
+            make_result('AAPL', 'BUY', 0.7),
+            make_result('MSFT', 'HOLD', 0.9),
+            make_result('TSLA', 'SELL', 0.8),
+            make_result('GOOGL', 'BUY', 0.7),
+        ]
+        discovered_stocks = [
+            Mock(symbol='AAPL', mention_count=2),
+            Mock(symbol='GOOGL', mention_count=5),
+        ]
+        
+        filtered = filter_actionable_recommendations(results, discovered_stocks)
+        
+        assert [r.symbol for r in filtered] == ['TSLA', 'GOOGL', 'AAPL']
@@ -0,0 +1,84 @@
+"""Unit tests for password hashing in the auth module."""
+
+import hashlib
+from src.auth import Authenticator, _load_credentials, generate_password_hash, verify_password_hash
+
+
+class TestPasswordHashing:
+    """Tests for generating and verifying password hashes."""
+    
+    def test_generated_hash_verifies(self):
+        """Test a generated hash accepts the right password only."""
+        password_hash = generate_password_hash('s3cret')
+        
+        assert password_hash.startswith('scrypt:')
+        assert verify_password_hash('s3cret', password_hash)
+        assert not verify_password_hash('wrong', password_hash)
+    
+    def test_hashes_are_salted(self):
+        """Test hashing the same password twice gives different hashes."""
+        assert generate_password_hash('s3cret') != generate_password_hash('s3cret')
+    
+    def test_legacy_sha256_hash_still_verifies(self):
+        """Test unprefixed SHA-256 hashes from older setups are accepted."""
+        legacy_hash = hashlib.sha256(b's3cret').hexdigest()
+        
+        assert verify_password_hash('s3cret', legacy_hash)
+        assert not verify_password_hash('wrong', legacy_hash)
+    
+    def test_malformed_scrypt_hash_rejected(self):
+        """Test a malformed scrypt hash fails verification instead of raising."""
+        assert not verify_password_hash('s3cret', 'scrypt:not-a-hash')
+
+
+class TestLoadCredentials:
+    """Tests for loading credentials from the environment."""
+    
+    def test_plain_password_hashed_once(self, monkeypatch):
+        """Test AUTH_PASSWORD is hashed once and reused across calls."""
+        monkeypatch.delenv('AUTH_PASSWORD_HASH', raising=False)
+        monkeypatch.setenv('AUTH_USERNAME', 'trader')
+        monkeypatch.setenv('AUTH_PASSWORD', 's3cret')
+        _load_credentials.cache_clear()
+        
+        try:
+            username, password_hash = _load_credentials()
+            
+            assert username == 'trader'
+            assert verify_password_hash('s3cret', password_hash)
+            assert _load_credentials() == (username, password_hash)
+        finally:
+            _load_credentials.cache_clear()
+
+
+class TestAuthenticatorSession:
+    """Tests for the cached authentication state."""
+    
+    def test_login_and_logout_update_state(self, monkeypatch):
+        """Test login/logout keep the cached flags and session state in sync."""
+        monkeypatch.delenv('AUTH_PASSWORD_HASH', raising=False)
+        monkeypatch.setenv('AUTH_USERNAME', 'trader')
+        monkeypatch.setenv('AUTH_PASSWORD', 's3cret')
+        _load_credentials.cache_clear()
+        
+        try:
+            auth = Authenticator()
+            auth.logout()
+            
+            assert auth.login('trader', 'wrong') == (False, "Invalid username or password")
+            assert not auth.is_authenticated()
+            
+            success, _ = auth.login('trader', 's3cret')
+            assert success
+            assert auth.is_authenticated()
+            assert auth.get_username() == 'trader'
+            
+            # A fresh instance on the next rerun picks up the session state
+            assert Authenticator().is_authenticated()
+            
+            auth.logout()
+            assert not auth.is_authenticated()
+            assert auth.get_username() is None
+            assert not Authenticator().is_authenticated()
+        finally:
+            _load_credentials.cache_clear()
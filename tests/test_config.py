@@ -0,0 +1,113 @@
+"""Unit tests for configuration loading and saving."""
+
+import json
+import os
+from dataclasses import fields
+
+from src.config import Configuration, _load_dotenv_once
+
+
+class TestConfigurationLoad:
+    """Tests for loading configuration files."""
+    
+    def test_missing_file_returns_defaults(self, tmp_path):
+        """Test a missing config file falls back to the default configuration."""
+        cfg = Configuration.load(str(tmp_path / 'missing.json'))
+        
+        assert cfg.risk_tolerance == 'moderate'
+        assert cfg.sentiment_weight == 0.5
+    
+    def test_repeated_loads_return_independent_instances(self, tmp_path):
+        """Test cached loads don't share mutable state between instances."""
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({'risk_tolerance': 'aggressive', 'api_keys': {'news_api': 'abc'}}))
+        
+        first = Configuration.load(str(path))
+        first.api_keys['news_api'] = 'changed'
+        first.sentiment_weight = 0.9
+        second = Configuration.load(str(path))
+        
+        assert second is not first
+        assert second.risk_tolerance == 'aggressive'
+        assert second.api_keys['news_api'] == 'abc'
+        assert second.sentiment_weight == 0.5
+    
+    def test_edited_file_is_reloaded(self, tmp_path):
+        """Test a changed config file is re-read rather than served from cache."""
+        path = tmp_path / 'config.json'
+        path.write_text(json.dumps({'risk_tolerance': 'conservative'}))
+        assert Configuration.load(str(path)).risk_tolerance == 'conservative'
+        
+        path.write_text(json.dumps({'risk_tolerance': 'aggressive'}))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert Configuration.load(str(path)).risk_tolerance == 'aggressive'
+
+
+class TestConfigurationSave:
+    """Tests for serialising configuration."""
+    
+    def test_to_dict_covers_every_field(self):
+        """Test to_dict lists exactly the dataclass fields."""
+        cfg = Configuration()
+        
+        assert set(cfg.to_dict()) == {f.name for f in fields(Configuration)}
+    
+    def test_save_round_trips(self, tmp_path):
+        """Test a saved configuration loads back with the same values."""
+        path = tmp_path / 'config.json'
+        cfg = Configuration(risk_tolerance='aggressive', cache_ttl_seconds=60)
+        cfg.save(str(path))
+        
+        assert Configuration.load(str(path)).to_dict() == cfg.to_dict()
+
+
+class TestNormalizeWeights:
+    """Tests for normalizing analysis weights."""
+    
+    def test_weights_scaled_to_sum_to_one(self):
+        """Test unnormalized weights are scaled proportionally."""
+        cfg = Configuration(sentiment_weight=2.0, technical_weight=1.0, fundamental_weight=1.0)
+        cfg.normalize_weights()
+        
+        assert (cfg.sentiment_weight, cfg.technical_weight, cfg.fundamental_weight) == (0.5, 0.25, 0.25)
+    
+    def test_normalized_weights_left_unchanged(self):
+        """Test weights that already sum to one are not rescaled."""
+        cfg = Configuration(sentiment_weight=0.7, technical_weight=0.2, fundamental_weight=0.1)
+        cfg.normalize_weights()
+        
+        assert (cfg.sentiment_weight, cfg.technical_weight, cfg.fundamental_weight) == (0.7, 0.2, 0.1)
+    
+    def test_zero_weights_reset_to_defaults(self):
+        """Test all-zero weights fall back to the default split."""
+        cfg = Configuration(sentiment_weight=0.0, technical_weight=0.0, fundamental_weight=0.0)
+        cfg.normalize_weights()
+        
+        assert (cfg.sentiment_weight, cfg.technical_weight, cfg.fundamental_weight) == (0.5, 0.3, 0.2)
+
+
+class TestApiKeysFromEnvironment:
+    """Tests for filling API keys from environment variables."""
+    
+    def test_missing_keys_filled_from_environment(self, monkeypatch):
+        """Test empty API keys are taken from the environment but set ones are kept."""
+        _load_dotenv_once()
+        monkeypatch.setenv('NEWS_API_KEY', 'env-news')
+        monkeypatch.setenv('FINNHUB_API_KEY', 'env-finnhub')
+        
+        cfg = Configuration(api_keys={'news_api': '', 'finnhub': 'file-finnhub'})
+        
+        assert cfg.api_keys['news_api'] == 'env-news'
+        assert cfg.api_keys['finnhub'] == 'file-finnhub'
+        assert cfg.finnhub_api_key == 'env-finnhub'
+    
+    def test_finnhub_attribute_falls_back_to_config(self, monkeypatch):
+        """Test finnhub_api_key uses the configured key when the variable is unset."""
+        _load_dotenv_once()  # so a local .env can't set the variable afterwards
+        monkeypatch.delenv('FINNHUB_API_KEY', raising=False)
+        
+        cfg = Configuration(api_keys={'finnhub': 'file-finnhub'})
+        
+        assert cfg.finnhub_api_key == 'file-finnhub'
@@ -0,0 +1,401 @@
+"""Unit tests for the data provider's news aggregation and caching."""
+
+import json
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from cachetools import TLRUCache
+
+from src.config import Configuration
+from src.data_provider import (
+    DataProvider, InsufficientDataError, NewsArticle, parse_json_response
+)
+
+
+def _article(title):
+    """Build a minimal news article."""
+    return NewsArticle(title=title, content=title, url='', published_at=datetime(2025, 1, 1))
+
+
+class TestGetNews:
+    """Tests for combining news from several sources."""
+    
+    def setup_method(self):
+        """Set up a provider with the default configuration."""
+        self.provider = DataProvider(Configuration())
+    
+    def teardown_method(self):
+        """Close the provider's HTTP session."""
+        self.provider.close()
+    
+    def test_sources_merged_in_order(self):
+        """Test articles keep the Yahoo, Finnhub, NewsAPI order after merging."""
+        with patch.object(self.provider, '_fetch_yahoo_news', return_value=[_article('Alpha beats estimates')]), \
+             patch.object(self.provider, '_fetch_finnhub_news', return_value=[_article('Beta cuts guidance')]), \
+             patch.object(self.provider, '_fetch_newsapi_news', return_value=[_article('Gamma names new CEO')]):
+            articles = self.provider.get_news('TEST')
+        
+        assert [a.title for a in articles] == [
+            'Alpha beats estimates', 'Beta cuts guidance', 'Gamma names new CEO'
+        ]
+    
+    def test_sources_fetched_concurrently(self):
+        """Test the three sources are fetched at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def fetch(title):
+            def fetcher(symbol, days):
+                barrier.wait()
+                return [_article(title)]
+            return fetcher
+        
+        with patch.object(self.provider, '_fetch_yahoo_news', side_effect=fetch('Alpha beats estimates')), \
+             patch.object(self.provider, '_fetch_finnhub_news', side_effect=fetch('Beta cuts guidance')), \
+             patch.object(self.provider, '_fetch_newsapi_news', side_effect=fetch('Gamma names new CEO')):
+            articles = self.provider.get_news('TEST')
+        
+        assert len(articles) == 3
+    
+    def test_pool_reused_across_calls(self):
+        """Test news fetches share the provider's pool rather than creating one per call."""
+        threads = set()
+        
+        def fetcher(symbol, days):
+            threads.add(threading.current_thread().name)
+            return []
+        
+        with patch.object(self.provider, '_fetch_yahoo_news', side_effect=fetcher), \
+             patch.object(self.provider, '_fetch_finnhub_news', side_effect=fetcher), \
+             patch.object(self.provider, '_fetch_newsapi_news', side_effect=fetcher), \
+             patch('src.data_provider.ThreadPoolExecutor') as executor:
+            self.provider.get_news('AAA')
+            self.provider.get_news('BBB')
+        
+        executor.assert_not_called()
+        assert threads
+        assert all(name.startswith('data-provider') for name in threads)
+
+
+class TestDeduplicateArticles:
+    """Tests for removing near-duplicate news titles."""
+    
+    def setup_method(self):
+        """Set up a provider with the default configuration."""
+        self.provider = DataProvider(Configuration())
+    
+    def teardown_method(self):
+        """Close the provider's HTTP session."""
+        self.provider.close()
+    
+    def test_near_duplicate_titles_dropped(self):
+        """Test titles sharing more than 80% of their words keep only the first."""
+        articles = [
+            _article('Acme shares jump after strong quarterly earnings report today'),
+            _article('ACME  shares jump after strong quarterly earnings report'),
+            _article('Acme shares fall on weak guidance'),
+        ]
+        
+        unique = self.provider._deduplicate_articles(articles)
+        
+        assert unique == [articles[0], articles[2]]
+    
+    def test_partial_overlap_kept(self):
+        """Test titles sharing 80% of words or fewer are both kept."""
+        articles = [
+            _article('one two three four five'),
+            _article('one two three four six'),
+        ]
+        
+        assert self.provider._deduplicate_articles(articles) == articles
+
+
+class TestCacheExpiry:
+    """Tests for per-kind cache lifetimes."""
+    
+    def setup_method(self):
+        """Set up a provider with a five-minute cache TTL."""
+        self.provider = DataProvider(Configuration(cache_ttl_seconds=300))
+    
+    def teardown_method(self):
+        """Close the provider's HTTP session."""
+        self.provider.close()
+    
+    def test_price_and_news_use_configured_ttl(self):
+        """Test volatile data expires after the configured TTL."""
+        assert self.provider._cache_expiry('stock_data_AAPL', None, 1000.0) == 1300.0
+        assert self.provider._cache_expiry('news_AAPL_7', None, 1000.0) == 1300.0
+    
+    def test_financials_kept_longer(self):
+        """Test financials are cached for at least an hour."""
+        assert self.provider._cache_expiry('financials_AAPL', None, 1000.0) == 4600.0
+    
+    def test_entries_expire(self):
+        """Test cached values disappear once their lifetime has passed."""
+        now = [0.0]
+        self.provider.cache = TLRUCache(maxsize=10, ttu=self.provider._cache_expiry, timer=lambda: now[0])
+        self.provider._set_cached('news_AAPL_7', ['article'])
+        self.provider._set_cached('financials_AAPL', 'financials')
+        
+        now[0] = 301.0
+        
+        assert self.provider._get_cached('news_AAPL_7') is None
+        assert self.provider._get_cached('financials_AAPL') == 'financials'
+
+
+class TestPrefetchHistory:
+    """Tests for batching price history downloads."""
+    
+    def setup_method(self):
+        """Set up a provider with the default configuration."""
+        self.provider = DataProvider(Configuration())
+    
+    def teardown_method(self):
+        """Close the provider's HTTP session."""
+        self.provider.close()
+    
+    def _download(self, symbols, days=220):
+        """Build a frame shaped like yf.download(..., group_by='ticker')."""
+        index = pd.date_range('2024-01-01', periods=days, freq='B')
+        columns = pd.MultiIndex.from_product([symbols, ['Open', 'High', 'Low', 'Close', 'Volume']])
+        data = pd.DataFrame(100.0, index=index, columns=columns)
+        data.loc[:, (slice(None), 'High')] = 101.0
+        data.loc[:, (slice(None), 'Volume')] = 1000.0
+        # The second symbol didn't trade on the first day
+        data.loc[index[0], (symbols[1], slice(None))] = np.nan
+        return data
+    
+    def test_history_stored_per_symbol(self):
+        """Test one download fills each symbol's history, minus non-trading days."""
+        with patch('src.data_provider.yf.download', return_value=self._download(['AAA', 'BBB'])) as download:
+            self.provider.prefetch_history(['AAA', 'BBB', 'AAA'])
+        
+        assert download.call_count == 1
+        assert download.call_args.args[0] == ['AAA', 'BBB']
+        # Adjusted like Ticker.history, whatever the yfinance default
+        assert download.call_args.kwargs['auto_adjust'] is True
+        assert download.call_args.kwargs['actions'] is False
+        assert len(self.provider._prefetched_history['AAA']) == 220
+        assert len(self.provider._prefetched_history['BBB']) == 219
+    
+    def test_large_batch_not_evicted(self):
+        """Test prefetched history outlasts the bounded cache for big batches."""
+        symbols = [f'S{i:03d}' for i in range(150)]
+        
+        with patch('src.data_provider.yf.download', return_value=self._download(symbols)):
+            self.provider.prefetch_history(symbols)
+        
+        assert len(self.provider._prefetched_history) == 150
+    
+    def test_single_symbol_not_batched(self):
+        """Test there is no batch download for a single symbol."""
+        with patch('src.data_provider.yf.download') as download:
+            self.provider.prefetch_history(['AAA'])
+        
+        download.assert_not_called()
+    
+    def test_stock_data_uses_prefetched_history(self):
+        """Test get_stock_data doesn't request history that was prefetched."""
+        with patch('src.data_provider.yf.download', return_value=self._download(['AAA', 'BBB'])):
+            self.provider.prefetch_history(['AAA', 'BBB'])
+        
+        with patch('src.data_provider.yf.Ticker') as ticker:
+            ticker.return_value.info = {
+                'regularMarketPrice': 100.0,
+                'volume': 500,
+                'exchangeTimezoneName': 'America/New_York',
+            }
+            stock_data = self.provider.get_stock_data('AAA')
+        
+        ticker.return_value.history.assert_not_called()
+        assert len(stock_data.historical_prices) == 220
+        assert stock_data.historical_prices[-1].high == 101.0
+        # Dated in the exchange's timezone, as Ticker.history would be
+        assert str(stock_data.historical_prices[0].date.tzinfo) == 'America/New_York'
+        assert stock_data.historical_prices[0].date.hour == 0
+        # Consumed on read
+        assert 'AAA' not in self.provider._prefetched_history
+
+
+class TestRetryWithBackoff:
+    """Tests for retrying failed fetches."""
+    
+    def setup_method(self):
+        """Set up a provider with the default configuration."""
+        self.provider = DataProvider(Configuration())
+    
+    def teardown_method(self):
+        """Close the provider's HTTP session."""
+        self.provider.close()
+    
+    def test_transient_error_retried(self):
+        """Test a network error is retried after a jittered delay."""
+        func = Mock(side_effect=[requests.ConnectionError('reset'), 'ok'])
+        
+        with patch('src.data_provider.time.sleep') as sleep:
+            assert self.provider._retry_with_backoff(func) == 'ok'
+        
+        assert func.call_count == 2
+        assert 0.5 <= sleep.call_args.args[0] <= 1.5
+    
+    def test_decode_error_retried(self):
+        """Test a malformed response body is retried like other transient errors."""
+        func = Mock(side_effect=[json.JSONDecodeError('Expecting value', '', 0), 'ok'])
+        
+        with patch('src.data_provider.time.sleep'):
+            assert self.provider._retry_with_backoff(func) == 'ok'
+        
+        assert func.call_count == 2
+    
+    def test_invalid_data_not_retried(self):
+        """Test an invalid symbol fails on the first attempt."""
+        func = Mock(side_effect=InsufficientDataError('Invalid symbol: NOPE'))
+        
+        with patch('src.data_provider.time.sleep') as sleep:
+            with pytest.raises(InsufficientDataError, match='Invalid symbol'):
+                self.provider._retry_with_backoff(func)
+        
+        assert func.call_count == 1
+        sleep.assert_not_called()
+
+
+class TestParseJsonResponse:
+    """Tests for decoding JSON API responses."""
+    
+    def test_body_decoded(self):
+        """Test the raw response body is decoded."""
+        response = Mock(content=b'{"articles": [{"title": "Acme"}]}')
+        
+        assert parse_json_response(response) == {'articles': [{'title': 'Acme'}]}
+    
+    def test_falls_back_without_orjson(self):
+        """Test requests' own decoder is used when orjson isn't installed."""
+        response = Mock()
+        response.json.return_value = {'articles': []}
+        
+        with patch('src.data_provider.orjson', None):
+            assert parse_json_response(response) == {'articles': []}
+
+
+class TestGetInfo:
+    """Tests for sharing ticker.info between price and financials fetches."""
+    
+    def setup_method(self):
+        """Set up a provider with the default configuration."""
+        self.provider = DataProvider(Configuration())
+    
+    def teardown_method(self):
+        """Close the provider's HTTP session."""
+        self.provider.close()
+    
+    def test_concurrent_callers_share_one_fetch(self):
+        """Test price and financials fetched together make one info request."""
+        calls = []
+        
+        class FakeTicker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+            
+            @property
+            def info(self):
+                calls.append(self.symbol)
+                time.sleep(0.05)
+                return {'regularMarketPrice': 100.0, 'trailingPE': 20.0}
+        
+        with patch('src.data_provider.yf.Ticker', FakeTicker):
+            threads = [
+                threading.Thread(target=self.provider.get_company_financials, args=('AAA',)),
+                threading.Thread(target=self.provider._get_info, args=('AAA',)),
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            financials = self.provider.get_company_financials('AAA')
+        
+        assert calls == ['AAA']
+        assert financials.pe_ratio == 20.0
+        assert self.provider._info_in_flight == {}
+    
+    def test_other_symbols_not_blocked(self):
+        """Test a slow info fetch for one symbol doesn't hold up another symbol."""
+        started = threading.Event()
+        release = threading.Event()
+        
+        class FakeTicker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+            
+            @property
+            def info(self):
+                if self.symbol == 'SLOW':
+                    started.set()
+                    release.wait(5)
+                return {'regularMarketPrice': 100.0}
+        
+        with patch('src.data_provider.yf.Ticker', FakeTicker):
+            slow = threading.Thread(target=self.provider._get_info, args=('SLOW',))
+            slow.start()
+            started.wait(5)
+            try:
+                assert self.provider._get_info('FAST') == {'regularMarketPrice': 100.0}
+                assert 'SLOW' in self.provider._info_in_flight
+            finally:
+                release.set()
+                slow.join()
+    
+    def test_fetch_error_shared_and_cleared(self):
+        """Test a failed info fetch raises for the caller and isn't left in flight."""
+        ticker = Mock()
+        type(ticker).info = property(Mock(side_effect=requests.ConnectionError('reset')))
+        
+        with patch('src.data_provider.yf.Ticker', return_value=ticker):
+            with pytest.raises(requests.ConnectionError):
+                self.provider._get_info('AAA')
+        
+        assert self.provider._info_in_flight == {}
+    
+    def test_empty_info_retried(self):
+        """Test an empty (throttled) info response is retried rather than treated as invalid."""
+        responses = [{}, {'regularMarketPrice': 100.0, 'trailingPE': 20.0}]
+        ticker = Mock()
+        type(ticker).info = property(lambda self: responses.pop(0))
+        
+        with patch('src.data_provider.yf.Ticker', return_value=ticker), \
+             patch('src.data_provider.time.sleep') as sleep:
+            financials = self.provider.get_company_financials('AAA')
+        
+        assert financials.pe_ratio == 20.0
+        assert sleep.call_count == 1
+    
+    def test_info_without_price_not_retried(self):
+        """Test info lacking a price fails as an invalid symbol on the first attempt."""
+        ticker = Mock()
+        ticker.info = {'trailingPegRatio': None}
+        
+        with patch('src.data_provider.yf.Ticker', return_value=ticker), \
+             patch('src.data_provider.time.sleep') as sleep:
+            with pytest.raises(InsufficientDataError, match='Invalid symbol'):
+                self.provider.get_stock_data('NOPE')
+        
+        sleep.assert_not_called()
+    
+    def test_incomplete_info_not_cached(self):
+        """Test an empty or throttled info response is fetched again."""
+        responses = [{}, {'trailingPE': 20.0}, {'regularMarketPrice': 100.0}]
+        ticker = Mock()
+        type(ticker).info = property(lambda self: responses.pop(0))
+        
+        with patch('src.data_provider.yf.Ticker', return_value=ticker):
+            assert self.provider._get_info('AAA') == {}
+            assert self.provider._get_info('AAA') == {'trailingPE': 20.0}
+            assert self.provider._get_info('AAA') == {'regularMarketPrice': 100.0}
+            assert self.provider._get_info('AAA') == {'regularMarketPrice': 100.0}
+        
+        assert responses == []
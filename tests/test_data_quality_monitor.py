@@ -194,6 +194,14 @@ class TestDataQualityMonitor:
         
         assert len(monitor.issues) == 0
     
+    def test_check_news_availability_precomputed_count(self):
+        """Test checking news availability with a precomputed source count."""
+        monitor = DataQualityMonitor()
+        monitor.check_news_availability(total_sources=2, expected_minimum=5)
+        
+        assert len(monitor.issues) == 1
+        assert "(2 of 5 expected)" in monitor.issues[0].reason
+    
     def test_check_price_freshness_fresh(self):
         """Test checking price freshness with fresh data."""
         monitor = DataQualityMonitor()
@@ -250,6 +250,18 @@ class TestDynamicWeights:
         assert recommendation.runtime_weights['fundamental'] == engine.config.fundamental_weight
         assert recommendation.runtime_weights['source'] == 'static'
     
+    def test_update_weights_applies_to_static_fallback(self, engine, sentiment, technical, fundamental):
+        """Test that updated weights are normalized and used without market context."""
+        engine.update_weights({'sentiment': 2.0, 'technical': 1.0, 'fundamental': 1.0})
+        
+        recommendation = engine.generate_recommendation(
+            sentiment, technical, fundamental, 100.0, None
+        )
+        
+        assert recommendation.runtime_weights['sentiment'] == pytest.approx(0.5)
+        assert recommendation.runtime_weights['technical'] == pytest.approx(0.25)
+        assert recommendation.runtime_weights['fundamental'] == pytest.approx(0.25)
+    
     def test_weights_sum_to_one(self, engine, sentiment, technical, fundamental):
         """Test that weights always sum to 1.0."""
         market_states = ["bullish", "neutral", "bearish", "volatile"]
@@ -165,6 +165,26 @@ class TestMarketContextAnalyzer:
         # Data provider should only be called once (3 times for 3 indices)
         assert mock_data_provider.get_stock_data.call_count == 3
     
+    def test_concurrent_calls_share_one_fetch(self, analyzer, mock_data_provider):
+        """Test that concurrent callers wait for a single cache refresh."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        nifty_prices = [21000] * 51
+        banknifty_prices = [46000] * 51
+        
+        mock_data_provider.get_stock_data.side_effect = [
+            create_mock_stock_data("^NSEI", 21000, create_price_points(nifty_prices)),
+            create_mock_stock_data("^NSEBANK", 46000, create_price_points(banknifty_prices)),
+            create_mock_stock_data("^INDIAVIX", 16.0, [])
+        ]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contexts = list(executor.map(lambda _: analyzer.get_market_context(), range(8)))
+        
+        # Every caller gets the same cached context from one fetch
+        assert all(context is contexts[0] for context in contexts)
+        assert mock_data_provider.get_stock_data.call_count == 3
+    
     def test_error_handling(self, analyzer, mock_data_provider):
         """Test graceful error handling when data fetch fails."""
         # Setup: Data provider raises exception
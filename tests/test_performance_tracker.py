@@ -0,0 +1,45 @@
+"""Unit tests for the performance tracker cache."""
+
+import os
+
+from src.performance_tracker import PerformanceTracker, get_tracker
+
+
+def _bump_mtime(path):
+    """Move a file's modification time forward so cached readers notice it."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestGetTracker:
+    """Tests for reusing trackers per storage path."""
+    
+    def test_unchanged_store_reuses_tracker(self, tmp_path):
+        """Test repeated lookups share one tracker while the file is unchanged."""
+        path = tmp_path / 'performance.json'
+        PerformanceTracker(str(path)).record_entry('AAPL', 'BUY', 100.0, 5, 0.1, 0.2, 0.3, 0.7)
+        
+        tracker = get_tracker(str(path))
+        
+        assert get_tracker(str(path)) is tracker
+        assert len(tracker.trades) == 1
+    
+    def test_external_write_reloads_tracker(self, tmp_path):
+        """Test a store written by another tracker is read again."""
+        path = tmp_path / 'performance.json'
+        assert get_tracker(str(path)).trades == []
+        
+        PerformanceTracker(str(path)).record_entry('AAPL', 'BUY', 100.0, 5, 0.1, 0.2, 0.3, 0.7)
+        _bump_mtime(path)
+        
+        assert len(get_tracker(str(path)).trades) == 1
+    
+    def test_closed_trade_visible_on_next_lookup(self, tmp_path):
+        """Test a trade closed through a cached tracker shows as closed afterwards."""
+        path = tmp_path / 'performance.json'
+        trade_id = PerformanceTracker(str(path)).record_entry('AAPL', 'BUY', 100.0, 5, 0.1, 0.2, 0.3, 0.7)
+        
+        get_tracker(str(path)).record_exit(trade_id, 110.0)
+        _bump_mtime(path)
+        
+        assert get_tracker(str(path)).get_open_trades() == []
@@ -1,7 +1,8 @@
 """Unit tests for Risk Manager."""
 
+import numpy as np
 import pytest
-from src.risk_manager import RiskManager
+from src.risk_manager import RiskManager, calculate_volatility
 from src.models import Position, ConcentrationRisk, CorrelationRisk
 
 
@@ -214,6 +215,24 @@ class TestSuggestPositionSize:
         assert low_vol_size > high_vol_size
 
 
+class TestCalculateVolatility:
+    """Tests for volatility calculation."""
+    
+    def test_matches_std_of_returns_over_lookback(self):
+        """Test volatility uses simple returns over the last 30 prices."""
+        prices = np.linspace(100.0, 160.0, 50) + np.sin(np.arange(50))
+        
+        recent = prices[-30:]
+        expected = np.std(np.diff(recent) / recent[:-1])
+        
+        assert calculate_volatility(prices) == pytest.approx(expected)
+    
+    def test_insufficient_prices_returns_zero(self):
+        """Test fewer than two prices yields zero volatility."""
+        assert calculate_volatility(np.array([100.0])) == 0.0
+        assert calculate_volatility(np.array([])) == 0.0
+
+
 class TestIdentifyConcentrationRisk:
     """Tests for concentration risk identification."""
     
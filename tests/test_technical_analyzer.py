@@ -231,6 +231,38 @@ class TestTechnicalAnalyzer:
         clustered = analyzer._cluster_levels([])
         
         assert clustered == []
+    
+    def test_support_floor_and_resistance_ceiling(self):
+        """Test the nearest-level helpers on TechnicalIndicators."""
+        indicators = TechnicalIndicators(
+            symbol="TEST",
+            ma_20=105.0,
+            ma_50=100.0,
+            ma_200=95.0,
+            rsi=55.0,
+            macd=1.5,
+            macd_signal=1.0,
+            support_levels=[92.0, 90.0],
+            resistance_levels=[108.0, 110.0],
+            technical_score=0.0
+        )
+        empty = TechnicalIndicators(
+            symbol="TEST",
+            ma_20=105.0,
+            ma_50=100.0,
+            ma_200=95.0,
+            rsi=55.0,
+            macd=1.5,
+            macd_signal=1.0,
+            support_levels=[],
+            resistance_levels=[],
+            technical_score=0.0
+        )
+        
+        assert indicators.support_floor == 90.0
+        assert indicators.resistance_ceiling == 110.0
+        assert empty.support_floor is None
+        assert empty.resistance_ceiling is None
 
 
 if __name__ == "__main__":